@@ -13,6 +13,7 @@ from django.utils.html import format_html
 from django.contrib.auth.admin import UserAdmin, GroupAdmin
 from django.contrib.auth.models import User, Group
 from django.contrib.contenttypes.models import ContentType
+from django import forms
 from django.db import models
 from django.forms import Textarea
 from django.http import JsonResponse
@@ -362,8 +363,31 @@ class CategoryAdmin(admin.ModelAdmin):
         self.message_user(request, f'{updated} categories unmarked as featured.')
     remove_featured.short_description = '⚪ Remove featured status'
 
+class ListingAdminForm(forms.ModelForm):
+    """
+    The list/dict JSON columns are NOT NULL: a cleared textarea saves the
+    column's empty default ([] or {}) instead of failing model validation.
+    """
+    EMPTY_JSON_FIELDS = (
+        'tags', 'tags_mk', 'amenities', 'amenities_mk',
+        'working_hours', 'working_hours_mk', 'menu', 'menu_mk',
+    )
+
+    class Meta:
+        model = Listing
+        fields = '__all__'
+
+    def clean(self):
+        cleaned_data = super().clean()
+        for name in self.EMPTY_JSON_FIELDS:
+            if name in cleaned_data and cleaned_data[name] is None:
+                cleaned_data[name] = Listing._meta.get_field(name).get_default()
+        return cleaned_data
+
+
 @admin.register(Listing, site=admin_site)
 class ListingAdmin(MultilingualAdminMixin, admin.ModelAdmin):
+    form = ListingAdminForm
     list_display = ('id', 'title', 'category', 'featured', 'trending', 'is_active', 'created_at', 'phone_number')
     list_filter = ('category', 'featured', 'trending', 'is_active', 'created_at')
     search_fields = ('title', 'address', 'category__name')
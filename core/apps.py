@@ -18,6 +18,14 @@ def _warm_caches_on_startup():
     log = logging.getLogger(__name__)
     # Brief delay so DB pool / Redis connections settle and the worker is fully booted.
     time.sleep(2)
+    try:
+        # Wishlist and home-section lookups go through ContentType's per-process cache;
+        # fill it with one query instead of on the first request per worker.
+        from django.contrib.contenttypes.models import ContentType
+        from core.models import Blog, Event, Listing, Promotion
+        ContentType.objects.get_for_models(Listing, Event, Promotion, Blog)
+    except Exception:
+        log.exception("Failed to warm content type cache on startup")
     try:
         from core.views import warm_home_sections_cache
         warm_home_sections_cache()
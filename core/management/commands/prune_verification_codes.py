@@ -0,0 +1,26 @@
+"""
+Management command to delete stale verification codes
+Usage: python manage.py prune_verification_codes [--days 1]
+"""
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from core.models import VerificationCode
+
+
+class Command(BaseCommand):
+    help = 'Delete verification codes older than the given number of days (used or expired codes are never needed again)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=1,
+            help='Delete codes created more than this many days ago (default: 1)',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        # Codes expire after 15 minutes, so anything past the cutoff is dead weight
+        deleted, _ = VerificationCode.objects.filter(created_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} verification codes.'))
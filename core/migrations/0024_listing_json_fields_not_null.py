@@ -0,0 +1,64 @@
+from django.db import migrations, models
+
+
+LIST_FIELDS = ('tags', 'tags_mk', 'amenities', 'amenities_mk', 'menu', 'menu_mk')
+DICT_FIELDS = ('working_hours', 'working_hours_mk')
+
+
+def fill_null_json_fields(apps, schema_editor):
+    Listing = apps.get_model('core', 'Listing')
+    for field_name in LIST_FIELDS:
+        Listing.objects.filter(**{f'{field_name}__isnull': True}).update(**{field_name: []})
+    for field_name in DICT_FIELDS:
+        Listing.objects.filter(**{f'{field_name}__isnull': True}).update(**{field_name: {}})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_add_blurhash_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_null_json_fields, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='listing',
+            name='working_hours',
+            field=models.JSONField(blank=True, default=dict, help_text="Working hours structure, e.g., {'monday': '09:00-18:00', 'tuesday': '09:00-18:00', ...}"),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='working_hours_mk',
+            field=models.JSONField(blank=True, default=dict, help_text="Working hours in Macedonian, e.g., {'понedelник': '09:00-18:00', 'вторник': '09:00-18:00', ...}"),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='tags',
+            field=models.JSONField(blank=True, default=list, help_text="List of tags, e.g., ['Grill', 'Family', 'Outdoor']"),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='tags_mk',
+            field=models.JSONField(blank=True, default=list, help_text="List of tags in Macedonian, e.g., ['Скара', 'Семејно', 'Надворешно']"),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='amenities',
+            field=models.JSONField(blank=True, default=list, help_text="List of amenities with optional icon, e.g., [{'icon': 'wifi', 'text': 'Free Wi-Fi'}]"),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='amenities_mk',
+            field=models.JSONField(blank=True, default=list, help_text="List of amenities in Macedonian, e.g., [{'icon': 'wifi', 'text': 'Бесплатен Wi-Fi'}]"),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='menu',
+            field=models.JSONField(blank=True, default=list, help_text='Menu sections in English, e.g. [{"heading": "Coffee", "items": [{"name": "Espresso", "price": "80"}, {"name": "Water"}]}]'),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='menu_mk',
+            field=models.JSONField(blank=True, default=list, help_text='Menu sections in Macedonian, same structure as menu field'),
+        ),
+    ]
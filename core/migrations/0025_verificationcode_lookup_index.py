@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_listing_json_fields_not_null'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='verificationcode',
+            index=models.Index(fields=['email', 'is_used', '-created_at'], name='core_verifi_email_216134_idx'),
+        ),
+    ]
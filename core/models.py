@@ -50,6 +50,10 @@ class VerificationCode(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        # VerifyCode looks up the newest unused code for an email
+        indexes = [
+            models.Index(fields=['email', 'is_used', '-created_at']),
+        ]
 
     def __str__(self):
         return f"{self.email} - {self.code} - {'used' if self.is_used else 'active'}"
@@ -214,13 +218,11 @@ class Listing(models.Model):
         default=dict,
         help_text="Working hours structure, e.g., {'monday': '09:00-18:00', 'tuesday': '09:00-18:00', ...}",
         blank=True,
-        null=True,
     )
     working_hours_mk = models.JSONField(
         default=dict,
         help_text="Working hours in Macedonian, e.g., {'понedelник': '09:00-18:00', 'вторник': '09:00-18:00', ...}",
         blank=True,
-        null=True,
     )
     show_open_status = models.BooleanField(
         default=False,
@@ -233,8 +235,8 @@ class Listing(models.Model):
         help_text="Manually set Open/Closed status (used when working hours are not defined). True = Open, False = Closed, Null = Use working hours"
     )
     category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, blank=True, help_text="Select category from available categories")
-    tags = models.JSONField(default=list, help_text="List of tags, e.g., ['Grill', 'Family', 'Outdoor']", blank=True, null=True)
-    tags_mk = models.JSONField(default=list, help_text="List of tags in Macedonian, e.g., ['Скара', 'Семејно', 'Надворешно']", blank=True, null=True)
+    tags = models.JSONField(default=list, help_text="List of tags, e.g., ['Grill', 'Family', 'Outdoor']", blank=True)
+    tags_mk = models.JSONField(default=list, help_text="List of tags in Macedonian, e.g., ['Скара', 'Семејно', 'Надворешно']", blank=True)
     amenities_title = models.CharField(
         max_length=100,
         default="Amenities",
@@ -251,13 +253,11 @@ class Listing(models.Model):
         default=list,
         help_text="List of amenities with optional icon, e.g., [{'icon': 'wifi', 'text': 'Free Wi-Fi'}]",
         blank=True,
-        null=True,
     )
     amenities_mk = models.JSONField(
         default=list,
         help_text="List of amenities in Macedonian, e.g., [{'icon': 'wifi', 'text': 'Бесплатен Wi-Fi'}]",
         blank=True,
-        null=True,
     )
     MENU_ICON_CHOICES = [
         ('restaurant-outline', 'Restaurant / Food'),
@@ -296,13 +296,11 @@ class Listing(models.Model):
     menu = models.JSONField(
         default=list,
         blank=True,
-        null=True,
         help_text='Menu sections in English, e.g. [{"heading": "Coffee", "items": [{"name": "Espresso", "price": "80"}, {"name": "Water"}]}]',
     )
     menu_mk = models.JSONField(
         default=list,
         blank=True,
-        null=True,
         help_text='Menu sections in Macedonian, same structure as menu field',
     )
     menu_url = models.URLField(
@@ -782,12 +780,21 @@ class EventJoin(models.Model):
         return f"{self.user.username} joined {self.event.title}"
 
 
+class WishlistManager(models.Manager):
+    """Every wishlist read needs the item's content type, so join it by default."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('content_type')
+
+
 class Wishlist(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='wishlist_items')
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
     object_id = models.PositiveIntegerField()
     content_object = GenericForeignKey('content_type', 'object_id')
     created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = WishlistManager()
     
     class Meta:
         unique_together = ('user', 'content_type', 'object_id')
@@ -1,4 +1,4 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -11,3 +11,43 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
+
+
+class NewestFirstCursorPagination(CursorPagination):
+    """
+    Keyset pagination on -created_at for infinite scroll.
+    - Each page is a WHERE created_at < last_seen probe on the existing
+      (is_active, ..., -created_at) indexes, so deep pages cost the same as the first
+    - No COUNT(*): the response has next/previous links but no count
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-created_at'
+
+
+class PageOrCursorPagination(StandardResultsSetPagination):
+    """
+    Page-number pagination unless the client opts into cursors.
+    - Sending ?cursor= (empty for the first page) switches to
+      NewestFirstCursorPagination; the next/previous links carry the cursor on
+    - Without it the page-number contract (count/next/previous/results) is unchanged
+    """
+    cursor_pagination_class = NewestFirstCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.cursor_pagination_class.cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
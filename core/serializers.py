@@ -1,26 +1,202 @@
+import copy
+from datetime import datetime
+from functools import cached_property, lru_cache
+
+import pytz
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
 from django.utils import translation
 from .models import Category, Listing, Event, Promotion, Blog, BlogSection, EventJoin, Wishlist, UserProfile, UserPermission, HelpSupport, CollaborationContact, GuestUser, HomeSection, HomeSectionItem, TourismCarousel, TourismCategoryButton, GalleryPhoto
 
 
-def _build_image_urls(obj, request, field_names):
-    """Collect absolute URLs for a set of optional ImageFields."""
+_GALLERY_IMAGE_FIELDS = ("image", "image_1", "image_2", "image_3", "image_4", "image_5")
+
+
+def _absolute_url(url, request):
+    """Equivalent of ``request.build_absolute_uri(url)`` for storage URLs.
+
+    The ``scheme://host`` prefix is resolved once and cached on the request, so
+    serializing a page of objects doesn't re-parse every image URL.
+    """
+    if request is None or url.startswith(('http://', 'https://')):
+        return url
+    if not url.startswith('/') or url.startswith('//'):
+        return request.build_absolute_uri(url)
+    prefix = vars(request).get('_absolute_url_prefix')
+    if prefix is None:
+        prefix = request._absolute_url_prefix = request.build_absolute_uri('/')[:-1]
+    return prefix + url
+
+
+@lru_cache(maxsize=None)
+def _field_storage(model, field_name):
+    return model._meta.get_field(field_name).storage
+
+
+def _build_image_urls(obj, request, field_names, first_only=False):
+    """Collect absolute URLs for a set of optional ImageFields.
+
+    With ``first_only`` the loop stops at the first usable image, for callers
+    that only need the primary URL.
+
+    Freshly loaded rows hold the stored file name as a plain string; that name
+    goes straight to the field's storage instead of wrapping every slot
+    (including the empty ones) in an ImageFieldFile first.
+    """
     urls = []
+    values = obj.__dict__
     for field_name in field_names:
-        image_field = getattr(obj, field_name, None)
-        if not image_field:
-            continue
-        try:
-            url = image_field.url
-        except (ValueError, AttributeError):
-            # File exists in DB but not in storage, or field doesn't have url attr
-            continue
-        urls.append(request.build_absolute_uri(url) if request else url)
+        raw = values.get(field_name)
+        if isinstance(raw, str):
+            if not raw:
+                continue
+            url = _field_storage(type(obj), field_name).url(raw)
+        else:
+            # Deferred, already wrapped in a FieldFile, or not a model field at all
+            image_field = getattr(obj, field_name, None)
+            if not image_field:
+                continue
+            try:
+                url = image_field.url
+            except (ValueError, AttributeError):
+                # File exists in DB but not in storage, or field doesn't have url attr
+                continue
+        urls.append(_absolute_url(url, request))
+        if first_only:
+            break
     return urls
 
 
+_MISSING = object()
+_SKOPJE_TZ = pytz.timezone('Europe/Skopje')
+_datetime_to_representation = serializers.DateTimeField().to_representation
+_date_to_representation = serializers.DateField().to_representation
+
+
+def open_status_clock():
+    """Snapshot of the local clock used by ``is_open``: (day name, short day name, minute of day)."""
+    now = datetime.now(_SKOPJE_TZ)
+    return now.strftime('%A').lower(), now.strftime('%a').lower(), now.hour * 60 + now.minute
+
+
+def editable_listing_ids(user, listing_ids=None):
+    """IDs of the listings ``user`` may edit, for O(1) ``can_edit`` checks.
+
+    Pass ``listing_ids`` to limit the lookup to the listings being rendered.
+    """
+    permissions = UserPermission.objects.filter(user=user, can_edit=True)
+    if listing_ids is not None:
+        permissions = permissions.filter(listing_id__in=listing_ids)
+    return set(permissions.values_list('listing_id', flat=True))
+
+
+def joined_event_ids(user):
+    """IDs of the events ``user`` has joined, for O(1) ``has_joined`` checks."""
+    return set(EventJoin.objects.filter(user=user).values_list('event_id', flat=True))
+
+
+class _LocalizedNames(dict):
+    """``field_name -> '<field_name>_<language>'`` for one language, filled on first use."""
+
+    def __init__(self, language):
+        super().__init__()
+        self.language = language
+
+    def __missing__(self, field_name):
+        name = self[field_name] = f'{field_name}_{self.language}'
+        return name
+
+
+# One table per language: per-row lookups reuse the attribute names instead of
+# formatting them for every field of every row.
+_LOCALIZED_NAMES = {code: _LocalizedNames(code) for code, _ in settings.LANGUAGES}
+
+
+def _localized(obj, field_name, language):
+    """Return a modeltranslation field in ``language``, falling back to English."""
+    names = _LOCALIZED_NAMES.get(language)
+    if names is None:
+        names = _LOCALIZED_NAMES.setdefault(language, _LocalizedNames(language))
+    value = getattr(obj, names[field_name], _MISSING)
+    if value is _MISSING:
+        return getattr(obj, f'{field_name}_en') or getattr(obj, field_name)
+    return value
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer that introspects its model once per class.
+
+    ``get_fields()`` normally rebuilds every model field on each instantiation.
+    The result is cached per class and each instance gets a deep copy, which
+    re-creates the fields from their constructor arguments - the same thing
+    DRF already does for declared fields.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        template = CachedFieldsModelSerializer._fields_cache.get(cls)
+        if template is None:
+            template = CachedFieldsModelSerializer._fields_cache[cls] = super().get_fields()
+        return copy.deepcopy(template)
+
+
+class LocalizedSerializerMixin:
+    """Resolve ``context['language']`` once per serializer instance rather than per field.
+
+    A ``many=True`` child shares the root context, so the lookup happens once per list.
+    """
+
+    @cached_property
+    def _lang(self):
+        return self.context.get('language', 'en')
+
+
+class GalleryImagesMixin:
+    """Memoize gallery URLs for the object currently being serialized.
+
+    ``image``, ``images``, ``thumbnail_image`` (and friends) all derive from the
+    same six ImageFields; only the last object is kept so a ``many=True`` child
+    serializer does not grow a cache across the whole page.
+    """
+
+    def _gallery_image_urls(self, obj):
+        cached = getattr(self, '_image_cache', None)
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        urls = _build_image_urls(obj, self.context.get('request'), _GALLERY_IMAGE_FIELDS)
+        self._image_cache = (obj, urls)
+        return urls
+
+
+class NestedSerializerMixin:
+    """Reuse one child serializer per class for every row the parent renders.
+
+    Instantiating a nested serializer per parent object re-binds all of its
+    fields; a cached instance binds them once and is fed rows through
+    ``to_representation``.
+    """
+
+    def _nested_serializer(self, serializer_class):
+        cache = self.__dict__.setdefault('_nested_serializers', {})
+        serializer = cache.get(serializer_class)
+        if serializer is None:
+            serializer = cache[serializer_class] = serializer_class(context=self.context)
+        return serializer
+
+    def _nested_representation(self, serializer_class, objs):
+        serializer = self._nested_serializer(serializer_class)
+        return [serializer.to_representation(obj) for obj in objs]
+
+    def _category_representation(self, obj):
+        category = obj.category
+        return category_payload(category, self.context) if category is not None else None
+
+
 def _get_optimized_image_url(obj, field_name, request):
     """Get absolute URL for an ImageField or ImageSpecField."""
     image_field = getattr(obj, field_name, None)
@@ -28,24 +204,62 @@ def _get_optimized_image_url(obj, field_name, request):
         return None
     try:
         url = image_field.url
-        return request.build_absolute_uri(url) if request else url
+        return _absolute_url(url, request)
     except (ValueError, AttributeError):
         # File exists in DB but not in storage, or field doesn't have url attr
         return None
 
 
-class CategorySerializer(serializers.ModelSerializer):
+def category_payload(category, context):
+    """
+    Plain-dict rendering of a Category, shared by CategorySerializer and the
+    category embedded in every listing/event/promotion row.
+    - ``name`` follows ``context['language']``
+    - ``item_count`` is only computed when ``context['include_item_count']`` is set
+    """
+    language = context.get('language', 'en')
+    if language == 'mk' and category.name_mk:
+        name = category.name_mk
+    elif language == 'en' and category.name_en:
+        name = category.name_en
+    else:
+        name = category.name_en or category.name_mk or category.name
+    request = context.get('request')
+    return {
+        'id': category.id,
+        'name': name,
+        'name_en': category.name_en,
+        'name_mk': category.name_mk,
+        'slug': category.slug,
+        'icon': category.icon,
+        'order': category.order,
+        'is_active': category.is_active,
+        'trending': category.trending,
+        'featured': category.featured,
+        # Stored as a single choice; the frontend expects a list
+        'applies_to': [category.applies_to] if category.applies_to else [],
+        'item_count': category.get_item_count() if context.get('include_item_count', False) else 0,
+        'image_url': (
+            _get_optimized_image_url(category, 'image_thumbnail', request)
+            or _get_optimized_image_url(category, 'image', request)
+        ),
+        'created_at': _datetime_to_representation(category.created_at),
+        'updated_at': _datetime_to_representation(category.updated_at),
+    }
+
+
+class CategorySerializer(CachedFieldsModelSerializer):
     """Standard category serializer with language-aware name"""
-    name = serializers.SerializerMethodField()
+    name = serializers.CharField(read_only=True)
     name_en = serializers.CharField(required=False, allow_blank=True)
     name_mk = serializers.CharField(required=False, allow_blank=True)
-    item_count = serializers.SerializerMethodField()
+    item_count = serializers.IntegerField(read_only=True)
     applies_to = serializers.ListField(
         child=serializers.CharField(),
         required=False,
         help_text="List of content types this category applies to"
     )
-    image_url = serializers.SerializerMethodField()
+    image_url = serializers.CharField(read_only=True)
 
     class Meta:
         model = Category
@@ -56,44 +270,11 @@ class CategorySerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "slug", "created_at", "updated_at"]
 
-    def get_name(self, obj):
-        """Return name in the requested language"""
-        language = self.context.get('language', 'en')
-        if language == 'mk' and obj.name_mk:
-            return obj.name_mk
-        elif language == 'en' and obj.name_en:
-            return obj.name_en
-        return obj.name_en or obj.name_mk or obj.name
-
-    def get_item_count(self, obj):
-        """
-        Return the number of items in this category and its descendants.
-        PERFORMANCE FIX: Only calculate when explicitly requested, not on every serialization.
-        Returns 0 by default to avoid expensive calculation.
-        """
-        # Only calculate if explicitly requested via context
-        if self.context.get('include_item_count', False):
-            return obj.get_item_count()
-        return 0
-
-    def get_image_url(self, obj):
-        request = self.context.get('request')
-        return (
-            _get_optimized_image_url(obj, 'image_thumbnail', request)
-            or _get_optimized_image_url(obj, 'image', request)
-        )
-
     def to_representation(self, instance):
-        """Convert applies_to from CharField to list"""
-        ret = super().to_representation(instance)
-        # Convert applies_to from string to list for consistency with frontend
-        if 'applies_to' in ret and isinstance(ret['applies_to'], str):
-            ret['applies_to'] = [ret['applies_to']]
-        return ret
+        return category_payload(instance, self.context)
 
 
-
-class SimplifiedListingSerializer(serializers.ModelSerializer):
+class SimplifiedListingSerializer(LocalizedSerializerMixin, CachedFieldsModelSerializer):
     """Simplified listing serializer without nested relationships to avoid circular references."""
     title = serializers.SerializerMethodField()
     address = serializers.SerializerMethodField()
@@ -108,16 +289,13 @@ class SimplifiedListingSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "address", "description", "category", "image", "image_thumbnail", "image_medium", "blurhash", "phone_number"]
 
     def get_title(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'title_{language}', obj.title_en or obj.title)
+        return _localized(obj, 'title', self._lang)
 
     def get_address(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'address_{language}', obj.address_en or obj.address)
+        return _localized(obj, 'address', self._lang)
 
     def get_description(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'description_{language}', obj.description_en or obj.description)
+        return _localized(obj, 'description', self._lang)
 
     def get_image(self, obj):
         request = self.context.get('request')
@@ -133,7 +311,58 @@ class SimplifiedListingSerializer(serializers.ModelSerializer):
         return _get_optimized_image_url(obj, 'image_medium', request)
 
 
-class SimplifiedEventSerializer(serializers.ModelSerializer):
+class ListingSlimSerializer(LocalizedSerializerMixin, serializers.Serializer):
+    """Minimal listing card (id, title, address, first image) nested in promotions."""
+    id = serializers.IntegerField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    address = serializers.CharField(read_only=True)
+    image = serializers.CharField(read_only=True)
+
+    # Columns to_representation reads; used to .only() the prefetch queryset
+    only_fields = (
+        'id', *_GALLERY_IMAGE_FIELDS,
+        *(f'{field}_{code}' for field in ('title', 'address') for code, _ in settings.LANGUAGES),
+    )
+
+    @cached_property
+    def _column_names(self):
+        """(title, address) attribute names for this serializer's language."""
+        return f'title_{self._lang}', f'address_{self._lang}'
+
+    def to_representation(self, instance):
+        """Plain dict from the slim prefetched row; no per-row field machinery."""
+        title_name, address_name = self._column_names
+        title = getattr(instance, title_name, _MISSING)
+        address = getattr(instance, address_name, _MISSING)
+        images = _build_image_urls(instance, self.context.get('request'), _GALLERY_IMAGE_FIELDS, first_only=True)
+        return {
+            'id': instance.id,
+            'title': instance.title if title is _MISSING else title,
+            'address': instance.address if address is _MISSING else address,
+            'image': images[0] if images else None,
+        }
+
+
+def featured_cards(queryset, request, language):
+    """
+    Plain ``{id, title, image}`` dicts for the ``?fast=1`` featured strips.
+    - Reads ``values()`` rows, so no model instances or serializer fields are built
+    - ``image`` is the first filled gallery slot, as in ListingSlimSerializer
+    """
+    model = queryset.model
+    title_name = _LOCALIZED_NAMES[language]['title']
+    cards = []
+    for row in queryset.values('id', title_name, *_GALLERY_IMAGE_FIELDS):
+        image = None
+        for field_name in _GALLERY_IMAGE_FIELDS:
+            if row[field_name]:
+                image = _absolute_url(_field_storage(model, field_name).url(row[field_name]), request)
+                break
+        cards.append({'id': row['id'], 'title': row[title_name], 'image': image})
+    return cards
+
+
+class SimplifiedEventSerializer(LocalizedSerializerMixin, CachedFieldsModelSerializer):
     """Simplified event serializer without nested relationships to avoid circular references."""
     title = serializers.SerializerMethodField()
     location = serializers.SerializerMethodField()
@@ -148,16 +377,13 @@ class SimplifiedEventSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "date_time", "location", "description", "category", "image", "image_thumbnail", "image_medium", "blurhash", "entry_price"]
 
     def get_title(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'title_{language}', obj.title_en or obj.title)
+        return _localized(obj, 'title', self._lang)
 
     def get_location(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'location_{language}', obj.location_en or obj.location)
+        return _localized(obj, 'location', self._lang)
 
     def get_description(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'description_{language}', obj.description_en or obj.description)
+        return _localized(obj, 'description', self._lang)
 
     def get_image(self, obj):
         request = self.context.get('request')
@@ -173,7 +399,7 @@ class SimplifiedEventSerializer(serializers.ModelSerializer):
         return _get_optimized_image_url(obj, 'image_medium', request)
 
 
-class SimplifiedPromotionSerializer(serializers.ModelSerializer):
+class SimplifiedPromotionSerializer(LocalizedSerializerMixin, CachedFieldsModelSerializer):
     """Simplified promotion serializer for section/card display."""
     title = serializers.SerializerMethodField()
     description = serializers.SerializerMethodField()
@@ -187,15 +413,13 @@ class SimplifiedPromotionSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "description", "tags", "image", "image_thumbnail", "image_medium", "blurhash", "valid_until", "has_discount_code"]
 
     def get_title(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'title_{language}', obj.title_en or obj.title)
+        return _localized(obj, 'title', self._lang)
 
     def get_description(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'description_{language}', obj.description_en or obj.description)
+        return _localized(obj, 'description', self._lang)
 
     def get_tags(self, obj):
-        language = self.context.get('language', 'en')
+        language = self._lang
         if language == 'mk' and obj.tags_mk:
             return obj.tags_mk
         return obj.tags or []
@@ -214,7 +438,7 @@ class SimplifiedPromotionSerializer(serializers.ModelSerializer):
         return _get_optimized_image_url(obj, 'image_medium', request)
 
 
-class SimplifiedBlogSerializer(serializers.ModelSerializer):
+class SimplifiedBlogSerializer(LocalizedSerializerMixin, CachedFieldsModelSerializer):
     """Simplified blog serializer for section/card display."""
     title = serializers.SerializerMethodField()
     subtitle = serializers.SerializerMethodField()
@@ -229,16 +453,13 @@ class SimplifiedBlogSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "subtitle", "author", "category", "image", "image_thumbnail", "image_medium", "cover_image", "blurhash", "read_time_minutes"]
 
     def get_title(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'title_{language}', obj.title_en or obj.title)
+        return _localized(obj, 'title', self._lang)
 
     def get_subtitle(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'subtitle_{language}', obj.subtitle_en or obj.subtitle)
+        return _localized(obj, 'subtitle', self._lang)
 
     def get_author(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'author_{language}', obj.author_en or obj.author)
+        return _localized(obj, 'author', self._lang)
 
     def get_image(self, obj):
         request = self.context.get('request')
@@ -259,16 +480,16 @@ class SimplifiedBlogSerializer(serializers.ModelSerializer):
         return images[0] if images else None
 
 
-class ListingSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
-    address = serializers.SerializerMethodField()
-    tags = serializers.SerializerMethodField()
-    amenities_title = serializers.SerializerMethodField()
-    amenities = serializers.SerializerMethodField()
-    working_hours = serializers.SerializerMethodField()
+class ListingSerializer(LocalizedSerializerMixin, GalleryImagesMixin, NestedSerializerMixin, CachedFieldsModelSerializer):
+    title = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    address = serializers.CharField(read_only=True)
+    tags = serializers.JSONField(read_only=True)
+    amenities_title = serializers.CharField(read_only=True)
+    amenities = serializers.JSONField(read_only=True)
+    working_hours = serializers.JSONField(read_only=True)
     can_edit = serializers.SerializerMethodField()
-    show_open_status = serializers.SerializerMethodField()
+    show_open_status = serializers.BooleanField(read_only=True)
     is_open = serializers.SerializerMethodField()
     category = CategorySerializer(read_only=True)
     image = serializers.SerializerMethodField()
@@ -279,8 +500,8 @@ class ListingSerializer(serializers.ModelSerializer):
     images_medium = serializers.SerializerMethodField()
     promotions = serializers.SerializerMethodField()
     events = serializers.SerializerMethodField()
-    menu = serializers.SerializerMethodField()
-    menu_mk = serializers.SerializerMethodField()
+    menu = serializers.JSONField(read_only=True)
+    menu_mk = serializers.JSONField(read_only=True)
 
     class Meta:
         model = Listing
@@ -294,45 +515,55 @@ class ListingSerializer(serializers.ModelSerializer):
             "created_at", "updated_at", "can_edit"
         ]
     
-    def get_title(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'title_{language}', obj.title_en or obj.title)
-    
-    def get_description(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'description_{language}', obj.description_en or obj.description)
-    
-    def get_address(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'address_{language}', obj.address_en or obj.address)
-    
-    def get_tags(self, obj):
-        language = self.context.get('language', 'en')
-        if language == 'mk' and obj.tags_mk:
-            return obj.tags_mk or []
-        return obj.tags or []
-
-    def get_amenities_title(self, obj):
-        language = self.context.get('language', 'en')
-        if language == 'mk':
-            return getattr(obj, 'amenities_title_mk', 'Погодности') or getattr(obj, 'amenities_title', 'Погодности')
-        return getattr(obj, 'amenities_title', 'Amenities')
-
-    def get_amenities(self, obj):
-        language = self.context.get('language', 'en')
-        if language == 'mk' and obj.amenities_mk:
-            return obj.amenities_mk or []
-        return obj.amenities or []
-
-    def get_working_hours(self, obj):
-        language = self.context.get('language', 'en')
-        if language == 'mk' and obj.working_hours_mk:
-            return obj.working_hours_mk or {}
-        return obj.working_hours or {}
-
-    def get_show_open_status(self, obj):
-        """Get show_open_status field with safe default."""
-        return getattr(obj, 'show_open_status', False)
+    def to_representation(self, instance):
+        """Build the payload directly instead of walking ~20 bound fields per row."""
+        language = self._lang
+        is_mk = language == 'mk'
+        images = self._gallery_image_urls(instance)
+        return {
+            'id': instance.id,
+            'title': _localized(instance, 'title', language),
+            'description': _localized(instance, 'description', language),
+            'address': _localized(instance, 'address', language),
+            'category': self._category_representation(instance),
+            'tags': (instance.tags_mk if is_mk and instance.tags_mk else instance.tags) or [],
+            'amenities_title': (
+                (instance.amenities_title_mk or instance.amenities_title) if is_mk
+                else instance.amenities_title
+            ),
+            'amenities': (instance.amenities_mk if is_mk and instance.amenities_mk else instance.amenities) or [],
+            'working_hours': (
+                instance.working_hours_mk if is_mk and instance.working_hours_mk else instance.working_hours
+            ) or {},
+            'show_open_status': instance.show_open_status,
+            'is_open': self.get_is_open(instance),
+            'image': images[0] if images else None,
+            'images': images,
+            'thumbnail_image': self.get_thumbnail_image(instance),
+            'image_thumbnail': self.get_image_thumbnail(instance),
+            'image_medium': self.get_image_medium(instance),
+            'images_medium': images,
+            'blurhash': instance.blurhash,
+            'phone_number': instance.phone_number,
+            'facebook_url': instance.facebook_url,
+            'instagram_url': instance.instagram_url,
+            'website_url': instance.website_url,
+            'google_maps_url': instance.google_maps_url,
+            'featured': instance.featured,
+            'trending': instance.trending,
+            'is_active': instance.is_active,
+            'promotions': self.get_promotions(instance),
+            'events': self.get_events(instance),
+            'menu_label': instance.menu_label,
+            'menu_label_mk': instance.menu_label_mk,
+            'menu_icon': instance.menu_icon,
+            'menu': instance.menu or [],
+            'menu_mk': instance.menu_mk or [],
+            'menu_url': instance.menu_url,
+            'created_at': _datetime_to_representation(instance.created_at),
+            'updated_at': _datetime_to_representation(instance.updated_at),
+            'can_edit': self.get_can_edit(instance),
+        }
 
     def get_is_open(self, obj):
         """Calculate if the listing is currently open based on working hours."""
@@ -351,18 +582,8 @@ class ListingSerializer(serializers.ModelSerializer):
             if 'working_hours' in working_hours and isinstance(working_hours['working_hours'], dict):
                 working_hours = working_hours['working_hours']
 
-            from datetime import datetime
-            import pytz
-
-            # Get current time in Macedonia timezone (Europe/Skopje)
-            try:
-                tz = pytz.timezone('Europe/Skopje')
-                now = datetime.now(tz)
-            except:
-                now = datetime.now()
-
-            day_name = now.strftime('%A').lower()
-            day_name_short = now.strftime('%a').lower()
+            # The clock is resolved once per request (see ListingViewSet) or once per serializer
+            day_name, day_name_short, current_time = self._open_status_clock()
 
             if day_name not in working_hours and day_name_short not in working_hours:
                 return False
@@ -381,7 +602,6 @@ class ListingSerializer(serializers.ModelSerializer):
                 open_hour, open_min = map(int, open_time_str.split(':'))
                 close_hour, close_min = map(int, close_time_str.split(':'))
 
-                current_time = now.hour * 60 + now.minute
                 open_time = open_hour * 60 + open_min
                 close_time = close_hour * 60 + close_min
 
@@ -395,33 +615,33 @@ class ListingSerializer(serializers.ModelSerializer):
             logging.getLogger(__name__).exception("Error in get_is_open for listing %s", getattr(obj, 'id', '?'))
             return None
 
+    def _open_status_clock(self):
+        clock = self.context.get('open_status_clock')
+        if clock is None:
+            clock = getattr(self, '_clock', None)
+            if clock is None:
+                clock = self._clock = open_status_clock()
+        return clock
+
     def get_can_edit(self, obj):
         """Check if the current user has permission to edit this listing."""
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return False
-        # Use prefetched user_permissions when available to avoid N+1
-        if hasattr(obj, '_prefetched_objects_cache') and 'user_permissions' in obj._prefetched_objects_cache:
-            return any(
-                p.user_id == request.user.id and p.can_edit
-                for p in obj.user_permissions.all()
-            )
-        return UserPermission.objects.filter(
-            user=request.user,
-            listing=obj,
-            can_edit=True
-        ).exists()
+        # Views precompute the set once per request; otherwise load it once per serializer
+        editable_ids = self.context.get('editable_listing_ids')
+        if editable_ids is None:
+            editable_ids = getattr(self, '_editable_listing_ids', None)
+            if editable_ids is None:
+                editable_ids = self._editable_listing_ids = editable_listing_ids(request.user)
+        return obj.id in editable_ids
 
     def get_image(self, obj):
-        images = self._build_image_urls(obj)
+        images = self._gallery_image_urls(obj)
         return images[0] if images else None
 
     def get_images(self, obj):
-        return self._build_image_urls(obj)
-
-    def _build_image_urls(self, obj):
-        request = self.context.get('request')
-        return _build_image_urls(obj, request, ["image", "image_1", "image_2", "image_3", "image_4", "image_5"])
+        return self._gallery_image_urls(obj)
 
     def get_thumbnail_image(self, obj):
         """Return manual thumbnail URL with priority over auto-generated"""
@@ -430,7 +650,7 @@ class ListingSerializer(serializers.ModelSerializer):
         if obj.thumbnail_image:
             try:
                 url = obj.thumbnail_image.url
-                return request.build_absolute_uri(url) if request else url
+                return _absolute_url(url, request)
             except (ValueError, AttributeError):
                 pass
         # Fallback to main image
@@ -448,38 +668,26 @@ class ListingSerializer(serializers.ModelSerializer):
 
     def get_images_medium(self, obj):
         """Return array of medium-sized images for carousel - fallback to full-size if medium not available"""
-        return self._build_image_urls(obj)  # Keep full images for now as ImageSpecField only works on source field
+        return self._gallery_image_urls(obj)  # Keep full images for now as ImageSpecField only works on source field
 
     def get_promotions(self, obj):
         """Return serialized promotions associated with this listing."""
-        promotions = obj.promotions.all()
-        if not promotions.exists():
-            return []
-        # Use PromotionSerializer but need to pass context for language support
-        return PromotionSerializer(promotions, many=True, context=self.context).data
+        # Iterate the prefetched relation directly; an .exists() guard costs an extra query
+        return self._nested_representation(PromotionSerializer, obj.promotions.all())
 
     def get_events(self, obj):
         """Return serialized events associated with this listing."""
-        events = obj.events.all()
-        if not events.exists():
-            return []
         # Use SimplifiedEventSerializer to avoid circular reference
-        return SimplifiedEventSerializer(events, many=True, context=self.context).data
-
-    def get_menu(self, obj):
-        return obj.menu or []
+        return self._nested_representation(SimplifiedEventSerializer, obj.events.all())
 
-    def get_menu_mk(self, obj):
-        return obj.menu_mk or []
-
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(LocalizedSerializerMixin, GalleryImagesMixin, NestedSerializerMixin, CachedFieldsModelSerializer):
     has_joined = serializers.SerializerMethodField()
-    title = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
-    location = serializers.SerializerMethodField()
-    entry_price = serializers.SerializerMethodField()
-    age_limit = serializers.SerializerMethodField()
-    expectations = serializers.SerializerMethodField()
+    title = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    location = serializers.CharField(read_only=True)
+    entry_price = serializers.CharField(read_only=True)
+    age_limit = serializers.CharField(read_only=True)
+    expectations = serializers.JSONField(read_only=True)
     category = CategorySerializer(read_only=True)
     image = serializers.SerializerMethodField()
     images = serializers.SerializerMethodField()
@@ -500,59 +708,64 @@ class EventSerializer(serializers.ModelSerializer):
         ]
     
     def get_has_joined(self, obj):
-        """
-        Check if the current user has joined this event.
-        PERFORMANCE FIX: Uses prefetched 'user_joins' to avoid N+1 queries.
-        """
+        """Check if the current user has joined this event."""
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return False
-
-        # Use prefetched data if available (set by EventViewSet)
-        if hasattr(obj, 'user_joins'):
-            return len(obj.user_joins) > 0
-
-        # Fallback to query (for backwards compatibility)
-        from .models import EventJoin
-        return EventJoin.objects.filter(event=obj, user=request.user).exists()
-    
-    def get_title(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'title_{language}', obj.title_en or obj.title)
-    
-    def get_description(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'description_{language}', obj.description_en or obj.description)
-    
-    def get_location(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'location_{language}', obj.location_en or obj.location)
+        # Views precompute the set once per request; otherwise load it once per serializer
+        joined_ids = self.context.get('joined_event_ids')
+        if joined_ids is None:
+            joined_ids = getattr(self, '_joined_event_ids', None)
+            if joined_ids is None:
+                joined_ids = self._joined_event_ids = joined_event_ids(request.user)
+        return obj.id in joined_ids
     
-    def get_entry_price(self, obj):
-        language = self.context.get('language', 'en')
-        if language == 'mk' and obj.entry_price_mk:
-            return obj.entry_price_mk
-        return obj.entry_price
-    
-    def get_age_limit(self, obj):
-        language = self.context.get('language', 'en')
-        if language == 'mk' and obj.age_limit_mk:
-            return obj.age_limit_mk
-        return obj.age_limit
-    
-    def get_expectations(self, obj):
-        language = self.context.get('language', 'en')
-        if language == 'mk' and obj.expectations_mk:
-            return obj.expectations_mk
-        return obj.expectations
+    def to_representation(self, instance):
+        """Build the payload directly instead of walking the bound fields per row."""
+        language = self._lang
+        is_mk = language == 'mk'
+        images = self._gallery_image_urls(instance)
+        image = images[0] if images else None
+        return {
+            'id': instance.id,
+            'title': _localized(instance, 'title', language),
+            'description': _localized(instance, 'description', language),
+            'date_time': _datetime_to_representation(instance.date_time),
+            'location': _localized(instance, 'location', language),
+            'image': image,
+            'images': images,
+            'thumbnail_image': self.get_thumbnail_image(instance),
+            'image_thumbnail': self.get_image_thumbnail(instance),
+            'image_medium': self.get_image_medium(instance),
+            'cover_image': image,
+            'blurhash': instance.blurhash,
+            'entry_price': instance.entry_price_mk if is_mk and instance.entry_price_mk else instance.entry_price,
+            'category': self._category_representation(instance),
+            'age_limit': instance.age_limit_mk if is_mk and instance.age_limit_mk else instance.age_limit,
+            'expectations': (
+                instance.expectations_mk if is_mk and instance.expectations_mk else instance.expectations
+            ),
+            'join_count': instance.join_count,
+            'has_joined': self.get_has_joined(instance),
+            'featured': instance.featured,
+            'is_active': instance.is_active,
+            'show_join_button': instance.show_join_button,
+            'phone_number': instance.phone_number,
+            'facebook_url': instance.facebook_url,
+            'instagram_url': instance.instagram_url,
+            'website_url': instance.website_url,
+            'google_maps_url': instance.google_maps_url,
+            'listings': self.get_listings(instance),
+            'created_at': _datetime_to_representation(instance.created_at),
+            'updated_at': _datetime_to_representation(instance.updated_at),
+        }
 
     def get_image(self, obj):
         images = self.get_images(obj)
         return images[0] if images else None
 
     def get_images(self, obj):
-        request = self.context.get('request')
-        return _build_image_urls(obj, request, ["image", "image_1", "image_2", "image_3", "image_4", "image_5"])
+        return self._gallery_image_urls(obj)
 
     def get_cover_image(self, obj):
         """Return the primary event image (same as image field)."""
@@ -565,7 +778,7 @@ class EventSerializer(serializers.ModelSerializer):
         if obj.thumbnail_image:
             try:
                 url = obj.thumbnail_image.url
-                return request.build_absolute_uri(url) if request else url
+                return _absolute_url(url, request)
             except (ValueError, AttributeError):
                 pass
         # Fallback to main image
@@ -583,17 +796,14 @@ class EventSerializer(serializers.ModelSerializer):
 
     def get_listings(self, obj):
         """Return serialized listings associated with this event."""
-        listings = obj.listings.all()
-        if not listings.exists():
-            return []
         # Use SimplifiedListingSerializer to avoid circular reference
-        return SimplifiedListingSerializer(listings, many=True, context=self.context).data
+        return self._nested_representation(SimplifiedListingSerializer, obj.listings.all())
 
-class PromotionSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
-    address = serializers.SerializerMethodField()
-    tags = serializers.SerializerMethodField()
+class PromotionSerializer(LocalizedSerializerMixin, GalleryImagesMixin, NestedSerializerMixin, CachedFieldsModelSerializer):
+    title = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    address = serializers.CharField(read_only=True)
+    tags = serializers.JSONField(read_only=True)
     image = serializers.SerializerMethodField()
     images = serializers.SerializerMethodField()
     thumbnail_image = serializers.SerializerMethodField()
@@ -610,31 +820,44 @@ class PromotionSerializer(serializers.ModelSerializer):
             "instagram_url", "address", "google_maps_url", "category", "listings", "created_at", "updated_at"
         ]
 
-    def get_title(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'title_{language}', obj.title_en or obj.title)
-
-    def get_description(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'description_{language}', obj.description_en or obj.description)
-
-    def get_address(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'address_{language}', obj.address_en or obj.address)
-
-    def get_tags(self, obj):
-        language = self.context.get('language', 'en')
-        if language == 'mk' and obj.tags_mk:
-            return obj.tags_mk
-        return obj.tags
+    def to_representation(self, instance):
+        """Build the payload directly instead of walking the bound fields per row."""
+        language = self._lang
+        images = self._gallery_image_urls(instance)
+        return {
+            'id': instance.id,
+            'title': _localized(instance, 'title', language),
+            'description': _localized(instance, 'description', language),
+            'has_discount_code': instance.has_discount_code,
+            'discount_code': instance.discount_code,
+            'tags': instance.tags_mk if language == 'mk' and instance.tags_mk else instance.tags,
+            'image': images[0] if images else None,
+            'images': images,
+            'thumbnail_image': self.get_thumbnail_image(instance),
+            'image_thumbnail': self.get_image_thumbnail(instance),
+            'image_medium': self.get_image_medium(instance),
+            'blurhash': instance.blurhash,
+            'valid_until': _date_to_representation(instance.valid_until),
+            'featured': instance.featured,
+            'is_active': instance.is_active,
+            'website': instance.website,
+            'phone_number': instance.phone_number,
+            'facebook_url': instance.facebook_url,
+            'instagram_url': instance.instagram_url,
+            'address': _localized(instance, 'address', language),
+            'google_maps_url': instance.google_maps_url,
+            'category': self._category_representation(instance),
+            'listings': self.get_listings(instance),
+            'created_at': _datetime_to_representation(instance.created_at),
+            'updated_at': _datetime_to_representation(instance.updated_at),
+        }
 
     def get_image(self, obj):
         images = self.get_images(obj)
         return images[0] if images else None
 
     def get_images(self, obj):
-        request = self.context.get('request')
-        return _build_image_urls(obj, request, ["image", "image_1", "image_2", "image_3", "image_4", "image_5"])
+        return self._gallery_image_urls(obj)
 
     def get_thumbnail_image(self, obj):
         """Return manual thumbnail URL with priority over auto-generated"""
@@ -643,7 +866,7 @@ class PromotionSerializer(serializers.ModelSerializer):
         if obj.thumbnail_image:
             try:
                 url = obj.thumbnail_image.url
-                return request.build_absolute_uri(url) if request else url
+                return _absolute_url(url, request)
             except (ValueError, AttributeError):
                 pass
         # Fallback to main image
@@ -662,26 +885,9 @@ class PromotionSerializer(serializers.ModelSerializer):
     def get_listings(self, obj):
         """Return serialized listings associated with this promotion."""
         # To avoid circular import, we'll return minimal listing info
-        listings = obj.listings.all()
-        if not listings.exists():
-            return []
-        return [
-            {
-                'id': listing.id,
-                'title': getattr(listing, f'title_{self.context.get("language", "en")}', listing.title),
-                'address': getattr(listing, f'address_{self.context.get("language", "en")}', listing.address),
-                'image': self._get_listing_image(listing),
-            }
-            for listing in listings
-        ]
+        return self._nested_representation(ListingSlimSerializer, obj.listings.all())
 
-    def _get_listing_image(self, listing):
-        """Helper to get listing image URL."""
-        request = self.context.get('request')
-        images = _build_image_urls(listing, request, ["image", "image_1", "image_2", "image_3", "image_4", "image_5"])
-        return images[0] if images else None
-
-class BlogSectionSerializer(serializers.ModelSerializer):
+class BlogSectionSerializer(LocalizedSerializerMixin, serializers.ModelSerializer):
     """Serializer for collapsible blog sections with language support"""
     title = serializers.SerializerMethodField()
     content = serializers.SerializerMethodField()
@@ -692,7 +898,7 @@ class BlogSectionSerializer(serializers.ModelSerializer):
 
     def get_title(self, obj):
         """Return title in the current language"""
-        lang = self.context.get('language', 'en')
+        lang = self._lang
         if lang == 'mk' and obj.title_mk:
             return obj.title_mk
         if lang == 'en' and obj.title_en:
@@ -701,7 +907,7 @@ class BlogSectionSerializer(serializers.ModelSerializer):
 
     def get_content(self, obj):
         """Return content in the current language"""
-        lang = self.context.get('language', 'en')
+        lang = self._lang
         if lang == 'mk' and obj.content_mk:
             return obj.content_mk
         if lang == 'en' and obj.content_en:
@@ -709,19 +915,19 @@ class BlogSectionSerializer(serializers.ModelSerializer):
         return obj.content_en or obj.content_mk or obj.content
 
 
-class BlogSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    subtitle = serializers.SerializerMethodField()
-    content = serializers.SerializerMethodField()
-    author = serializers.SerializerMethodField()
+class BlogSerializer(LocalizedSerializerMixin, GalleryImagesMixin, NestedSerializerMixin, CachedFieldsModelSerializer):
+    title = serializers.CharField(read_only=True)
+    subtitle = serializers.CharField(read_only=True)
+    content = serializers.CharField(read_only=True)
+    author = serializers.CharField(read_only=True)
     image = serializers.SerializerMethodField()
     images = serializers.SerializerMethodField()
     thumbnail_image = serializers.SerializerMethodField()
     image_thumbnail = serializers.SerializerMethodField()
     image_medium = serializers.SerializerMethodField()
     cover_image = serializers.SerializerMethodField()
-    cta_button_title = serializers.SerializerMethodField()
-    cta_button_subtitle = serializers.SerializerMethodField()
+    cta_button_title = serializers.CharField(read_only=True)
+    cta_button_subtitle = serializers.CharField(read_only=True)
     cta_button_url = serializers.CharField(read_only=True)
     sections = BlogSectionSerializer(source='blog_sections', many=True, read_only=True)
 
@@ -733,29 +939,49 @@ class BlogSerializer(serializers.ModelSerializer):
             "published", "is_active", "cta_button_title", "cta_button_subtitle", "cta_button_url", "sections", "created_at", "updated_at"
         ]
     
-    def get_title(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'title_{language}', obj.title_en or obj.title)
-    
-    def get_subtitle(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'subtitle_{language}', obj.subtitle_en or obj.subtitle)
-    
-    def get_content(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'content_{language}', obj.content_en or obj.content)
-    
-    def get_author(self, obj):
-        language = self.context.get('language', 'en')
-        return getattr(obj, f'author_{language}', obj.author_en or obj.author)
+    def to_representation(self, instance):
+        """Build the payload directly instead of walking the bound fields per row."""
+        language = self._lang
+        images = self._gallery_image_urls(instance)
+        image = images[0] if images else None
+        return {
+            'id': instance.id,
+            'title': _localized(instance, 'title', language),
+            'subtitle': _localized(instance, 'subtitle', language),
+            'content': _localized(instance, 'content', language),
+            'author': _localized(instance, 'author', language),
+            'category': instance.category,
+            'tags': instance.tags,
+            'image': image,
+            'images': images,
+            'thumbnail_image': self.get_thumbnail_image(instance),
+            'image_thumbnail': self.get_image_thumbnail(instance),
+            'image_medium': self.get_image_medium(instance),
+            'cover_image': image,
+            'blurhash': instance.blurhash,
+            'read_time_minutes': instance.read_time_minutes,
+            'featured': instance.featured,
+            'published': instance.published,
+            'is_active': instance.is_active,
+            # Localized CTA copy falls back to the untranslated value
+            'cta_button_title': (
+                getattr(instance, f'cta_button_title_{language}', None) or instance.cta_button_title or None
+            ),
+            'cta_button_subtitle': (
+                getattr(instance, f'cta_button_subtitle_{language}', None) or instance.cta_button_subtitle or None
+            ),
+            'cta_button_url': instance.cta_button_url,
+            'sections': self._nested_representation(BlogSectionSerializer, instance.blog_sections.all()),
+            'created_at': _datetime_to_representation(instance.created_at),
+            'updated_at': _datetime_to_representation(instance.updated_at),
+        }
 
     def get_image(self, obj):
         images = self.get_images(obj)
         return images[0] if images else None
 
     def get_images(self, obj):
-        request = self.context.get('request')
-        return _build_image_urls(obj, request, ["image", "image_1", "image_2", "image_3", "image_4", "image_5"])
+        return self._gallery_image_urls(obj)
 
     def get_cover_image(self, obj):
         """Return the primary blog image (same as image field)."""
@@ -768,7 +994,7 @@ class BlogSerializer(serializers.ModelSerializer):
         if obj.thumbnail_image:
             try:
                 url = obj.thumbnail_image.url
-                return request.build_absolute_uri(url) if request else url
+                return _absolute_url(url, request)
             except (ValueError, AttributeError):
                 pass
         # Fallback to main image
@@ -784,24 +1010,6 @@ class BlogSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         return _get_optimized_image_url(obj, 'image_medium', request)
 
-    def get_cta_button_title(self, obj):
-        """Return CTA button title in the current language"""
-        language = self.context.get('language', 'en')
-        localized = getattr(obj, f'cta_button_title_{language}', None)
-        if localized:
-            return localized
-        # Fallback to default
-        return obj.cta_button_title or None
-
-    def get_cta_button_subtitle(self, obj):
-        """Return CTA button subtitle in the current language"""
-        language = self.context.get('language', 'en')
-        localized = getattr(obj, f'cta_button_subtitle_{language}', None)
-        if localized:
-            return localized
-        # Fallback to default
-        return obj.cta_button_subtitle or None
-
 class GuestUserSerializer(serializers.ModelSerializer):
     class Meta:
         model = GuestUser
@@ -848,7 +1056,15 @@ class UserSerializer(serializers.ModelSerializer):
         UserProfile.objects.create(user=user)
         return user
 
-class WishlistSerializer(serializers.ModelSerializer):
+_WISHLIST_SERIALIZERS = {
+    Listing: ListingSerializer,
+    Event: EventSerializer,
+    Promotion: PromotionSerializer,
+    Blog: BlogSerializer,
+}
+
+
+class WishlistSerializer(NestedSerializerMixin, serializers.ModelSerializer):
     item_type = serializers.CharField(read_only=True)
     item_data = serializers.SerializerMethodField()
     
@@ -859,20 +1075,28 @@ class WishlistSerializer(serializers.ModelSerializer):
     
     def get_item_data(self, obj):
         """Serialize the actual content object based on its type."""
+        # WishlistViewSet.list serializes all targets up front, grouped by type
+        bulk_item_data = self.context.get('wishlist_item_data')
+        if bulk_item_data is not None:
+            return bulk_item_data.get((obj.content_type_id, obj.object_id))
         content_object = obj.content_object
-        if isinstance(content_object, Listing):
-            return ListingSerializer(content_object, context=self.context).data
-        elif isinstance(content_object, Event):
-            return EventSerializer(content_object, context=self.context).data
-        elif isinstance(content_object, Promotion):
-            return PromotionSerializer(content_object, context=self.context).data
-        elif isinstance(content_object, Blog):
-            return BlogSerializer(content_object, context=self.context).data
-        return None
+        serializer_class = _WISHLIST_SERIALIZERS.get(type(content_object))
+        if serializer_class is None:
+            return None
+        return self._nested_serializer(serializer_class).to_representation(content_object)
+
+# item_type values accepted by the wishlist endpoints
+WISHLIST_MODELS = {
+    'listing': Listing,
+    'event': Event,
+    'promotion': Promotion,
+    'blog': Blog,
+}
+
 
 class WishlistCreateSerializer(serializers.Serializer):
     """Serializer for creating wishlist items."""
-    item_type = serializers.ChoiceField(choices=['listing', 'event', 'promotion', 'blog'])
+    item_type = serializers.ChoiceField(choices=list(WISHLIST_MODELS))
     item_id = serializers.IntegerField()
     
     def create(self, validated_data):
@@ -880,34 +1104,24 @@ class WishlistCreateSerializer(serializers.Serializer):
         item_type = validated_data['item_type']
         item_id = validated_data['item_id']
         
-        # Get the content type for the model
-        model_mapping = {
-            'listing': Listing,
-            'event': Event,
-            'promotion': Promotion,
-            'blog': Blog,
-        }
-        
-        model_class = model_mapping[item_type]
+        # get_for_model is served from ContentType's own cache
+        model_class = WISHLIST_MODELS[item_type]
         content_type = ContentType.objects.get_for_model(model_class)
         
         # Check if the item exists
-        try:
-            content_object = model_class.objects.get(id=item_id)
-        except model_class.DoesNotExist:
+        if not model_class.objects.filter(id=item_id).exists():
             raise serializers.ValidationError(f"{item_type.capitalize()} with id {item_id} does not exist.")
         
-        # Create or get the wishlist item
-        wishlist_item, created = Wishlist.objects.get_or_create(
-            user=user,
-            content_type=content_type,
-            object_id=item_id,
-        )
-        
-        if not created:
+        # A single INSERT; Wishlist's unique_together rejects duplicates
+        try:
+            with transaction.atomic():
+                return Wishlist.objects.create(
+                    user=user,
+                    content_type=content_type,
+                    object_id=item_id,
+                )
+        except IntegrityError:
             raise serializers.ValidationError("Item is already in wishlist.")
-        
-        return wishlist_item
 
 
 class UserPermissionSerializer(serializers.ModelSerializer):
@@ -950,17 +1164,22 @@ class CreateUserPermissionSerializer(serializers.Serializer):
 
 
 class EditListingSerializer(serializers.ModelSerializer):
+    # modeltranslation columns are always nullable; the edit form expects strings
+    _BILINGUAL_STR_FIELDS = ('title_en', 'title_mk', 'description_en', 'description_mk', 'address_en', 'address_mk')
+
     working_hours_mk = serializers.JSONField(required=False)
     tags_mk = serializers.ListField(required=False, allow_empty=True)
     amenities_mk = serializers.JSONField(required=False)
     menu = serializers.JSONField(required=False)
     menu_mk = serializers.JSONField(required=False)
-    image = serializers.ImageField(required=False, allow_null=True)
-    image_1 = serializers.ImageField(required=False, allow_null=True)
-    image_2 = serializers.ImageField(required=False, allow_null=True)
-    image_3 = serializers.ImageField(required=False, allow_null=True)
-    image_4 = serializers.ImageField(required=False, allow_null=True)
-    image_5 = serializers.ImageField(required=False, allow_null=True)
+    # Image fields are write-only here: to_representation renders their URLs
+    # itself, so DRF doesn't build (and then discard) a representation per image.
+    image = serializers.ImageField(required=False, allow_null=True, write_only=True)
+    image_1 = serializers.ImageField(required=False, allow_null=True, write_only=True)
+    image_2 = serializers.ImageField(required=False, allow_null=True, write_only=True)
+    image_3 = serializers.ImageField(required=False, allow_null=True, write_only=True)
+    image_4 = serializers.ImageField(required=False, allow_null=True, write_only=True)
+    image_5 = serializers.ImageField(required=False, allow_null=True, write_only=True)
 
     class Meta:
         model = Listing
@@ -997,36 +1216,22 @@ class EditListingSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         """Include current bilingual field values in response."""
-        data = super().to_representation(instance)
         request = self.context.get('request')
-        for field_name in ["image", "image_1", "image_2", "image_3", "image_4", "image_5"]:
-            url = ''
+        # Image URLs lead the payload, in Meta.fields order
+        data = {}
+        for field_name in _GALLERY_IMAGE_FIELDS:
             image_field = getattr(instance, field_name)
-            if image_field:
-                try:
-                    url = image_field.url
-                except ValueError:
-                    url = ''
-            if url and request:
-                url = request.build_absolute_uri(url)
-            data[field_name] = url
-
-        # Add current values for bilingual fields with proper None handling
-        data['title_en'] = getattr(instance, 'title_en', None) or ''
-        data['title_mk'] = getattr(instance, 'title_mk', None) or ''
-        data['description_en'] = getattr(instance, 'description_en', None) or ''
-        data['description_mk'] = getattr(instance, 'description_mk', None) or ''
-        data['address_en'] = getattr(instance, 'address_en', None) or ''
-        data['address_mk'] = getattr(instance, 'address_mk', None) or ''
-        data['working_hours_mk'] = getattr(instance, 'working_hours_mk', None) or {}
-        data['tags_mk'] = getattr(instance, 'tags_mk', None) or []
-        data['amenities_mk'] = getattr(instance, 'amenities_mk', None) or []
-        data['menu_label'] = getattr(instance, 'menu_label', None) or ''
-        data['menu_label_mk'] = getattr(instance, 'menu_label_mk', None) or ''
-        data['menu_icon'] = getattr(instance, 'menu_icon', None) or 'restaurant-outline'
-        data['menu'] = getattr(instance, 'menu', None) or []
-        data['menu_mk'] = getattr(instance, 'menu_mk', None) or []
-        data['menu_url'] = getattr(instance, 'menu_url', None) or ''
+            try:
+                data[field_name] = _absolute_url(image_field.url, request) if image_field else ''
+            except ValueError:
+                data[field_name] = ''
+        data.update(super().to_representation(instance))
+
+        # JSON and menu columns are NOT NULL with model defaults; only the
+        # modeltranslation columns and the blank-able icon need a fallback.
+        for field_name in self._BILINGUAL_STR_FIELDS:
+            data[field_name] = data[field_name] or ''
+        data['menu_icon'] = data['menu_icon'] or 'restaurant-outline'
 
         return data
     
@@ -1034,7 +1239,7 @@ class EditListingSerializer(serializers.ModelSerializer):
         """Update listing with validation for bilingual fields."""
         image_fields = {
             field_name: validated_data.pop(field_name, serializers.empty)
-            for field_name in ["image", "image_1", "image_2", "image_3", "image_4", "image_5"]
+            for field_name in _GALLERY_IMAGE_FIELDS
         }
         for attr, value in validated_data.items():
             if attr in {"working_hours", "working_hours_mk"}:
@@ -1081,6 +1286,17 @@ class HelpSupportSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+def _with_contact_defaults(validated_data, user):
+    """Auto-assign the submitting user and fill a blank name/email from their account."""
+    validated_data['user'] = user
+    if not validated_data.get('name'):
+        # Full name, falling back to the username
+        validated_data['name'] = user.get_full_name() or user.username
+    if not validated_data.get('email'):
+        validated_data['email'] = user.email or ''
+    return validated_data
+
+
 class HelpSupportCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating help support requests"""
     
@@ -1089,9 +1305,7 @@ class HelpSupportCreateSerializer(serializers.ModelSerializer):
         fields = ['name', 'email', 'category', 'subject', 'message', 'priority']
     
     def create(self, validated_data):
-        # Auto-assign the current user
-        validated_data['user'] = self.context['request'].user
-        return super().create(validated_data)
+        return super().create(_with_contact_defaults(validated_data, self.context['request'].user))
 
 
 class CollaborationContactSerializer(serializers.ModelSerializer):
@@ -1127,9 +1341,7 @@ class CollaborationContactCreateSerializer(serializers.ModelSerializer):
         ]
     
     def create(self, validated_data):
-        # Auto-assign the current user
-        validated_data['user'] = self.context['request'].user
-        return super().create(validated_data)
+        return super().create(_with_contact_defaults(validated_data, self.context['request'].user))
 
 
 class AssistantQuerySerializer(serializers.Serializer):
@@ -1404,7 +1616,7 @@ class TourismCategoryButtonSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         try:
             url = obj.background_image.url
-            return request.build_absolute_uri(url) if request else url
+            return _absolute_url(url, request)
         except ValueError:
             # File exists in DB but not in storage
             return None
@@ -1420,7 +1632,7 @@ class TourismScreenSerializer(serializers.Serializer):
     sections = HomeSectionSerializer(many=True, read_only=True)
 
 
-class GalleryPhotoSerializer(serializers.ModelSerializer):
+class GalleryPhotoSerializer(LocalizedSerializerMixin, serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
     thumbnail_url = serializers.SerializerMethodField()
     caption = serializers.SerializerMethodField()
@@ -1438,7 +1650,7 @@ class GalleryPhotoSerializer(serializers.ModelSerializer):
         return _get_optimized_image_url(obj, 'image_thumbnail', request)
 
     def get_caption(self, obj):
-        lang = self.context.get('language', 'en')
+        lang = self._lang
         if lang == 'mk' and obj.caption_mk:
             return obj.caption_mk
         return obj.caption or ''
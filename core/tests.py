@@ -1,13 +1,30 @@
+import gzip
 import io
+import json
+import os
+import tempfile
+from pathlib import Path
+from decimal import Decimal
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
 from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.contrib.contenttypes.models import ContentType
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 from django.contrib.auth.models import User
 from django.utils import timezone
 from datetime import timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from PIL import Image
 from core.assistant_parser import HeuristicAssistantQueryParser
-from core.models import Category, Event, Listing, Promotion, Blog, VerificationCode
+from core.authentication import ProfileJWTAuthentication
+from core.models import BlogSection, Category, CollaborationContact, Event, EventJoin, GalleryPhoto, GuestUser, HelpSupport, Listing, Promotion, Blog, VerificationCode, Wishlist, UserPermission, UserProfile
+from core.renderers import ORJSONRenderer
+from core.serializers import ListingSerializer
+from core.utils import get_preferred_language
 
 _DUMMY_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
 
@@ -99,6 +116,16 @@ class AssistantV2Tests(TestCase):
         self.assertNotIn("Free Jazz Night", titles)
         self.assertIn("Paid Concert", titles)
 
+    def test_bilingual_search_listings_fall_back_to_category_names(self):
+        from core.views import _assistant_bilingual_search
+        Listing.objects.create(title="Skara", title_en="Skara", title_mk="Скара", is_active=True, category=self.category)
+        Listing.objects.create(title="Food Corner", title_en="Food Corner", title_mk="Храна", is_active=True)
+        by_content = _assistant_bilingual_search("food", "", "listings", "en", self.request)
+        self.assertEqual([l["title"] for l in by_content["listings"]], ["Food Corner"])
+        Listing.objects.filter(title_en="Food Corner").delete()
+        by_category = _assistant_bilingual_search("food", "", "listings", "en", self.request)
+        self.assertEqual([l["title"] for l in by_category["listings"]], ["Skara"])
+
     def test_feed_response_filters_events_by_time(self):
         from core.views import _assistant_generic_feed_response
         result = _assistant_generic_feed_response(
@@ -138,7 +165,6 @@ class AssistantV2Tests(TestCase):
 
     def test_resolved_listing_includes_related_promotions(self):
         from core.views import _assistant_resolved_entity_response
-        from core.serializers import ListingSerializer
 
         listing = Listing.objects.create(
             title="Test Cafe",
@@ -156,6 +182,16 @@ class AssistantV2Tests(TestCase):
         result_types = [r['type'] for r in response['results']]
         self.assertIn('promotion', result_types)
 
+    def test_event_payload_date_time_is_a_string_for_the_results_summary(self):
+        from core.views import _build_goai_results_summary
+        from core.serializers import EventSerializer
+
+        self.event_free.date_time = timezone.now()
+        data = EventSerializer(self.event_free, context={'request': self.request, 'language': 'en'}).data
+        self.assertIsInstance(data['date_time'], str)
+        summary = _build_goai_results_summary({'results': [{'type': 'event', 'data': data}]})
+        self.assertEqual(summary, f"- event: Free Jazz Night on {data['date_time'][:10]}")
+
 
 class PublicContentWritePermissionTests(TestCase):
     """
@@ -307,6 +343,13 @@ class FileUploadValidationTests(TestCase):
     """Confirm file upload size and type limits on EditListingView."""
 
     def setUp(self):
+        # Accepted uploads (and their thumbnails) land in a throwaway media root
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media_root.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
         self.user = User.objects.create_user('editor', 'editor@test.com', 'pass')
         self.category = Category.objects.create(name='Food', slug='food', is_active=True)
         self.listing = Listing.objects.create(
@@ -341,6 +384,45 @@ class FileUploadValidationTests(TestCase):
         self.assertEqual(response.status_code, 200)
 
 
+class EditListingPermissionTests(TestCase):
+    """EditListingView answers 404 for unknown listings and 403 without an edit permission."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('editor', 'editor@test.com', 'pass')
+        self.listing = Listing.objects.create(title='Cafe', title_en='Cafe', is_active=True)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_status_codes(self):
+        url = f'/api/listings/{self.listing.pk}/edit/'
+        self.assertEqual(self.client.get(f'/api/listings/{self.listing.pk + 100}/edit/', secure=True).status_code, 404)
+        self.assertEqual(self.client.get(url, secure=True).status_code, 403)
+        UserPermission.objects.create(user=self.user, listing=self.listing, can_edit=False)
+        self.assertEqual(self.client.get(url, secure=True).status_code, 403)
+        UserPermission.objects.filter(user=self.user).update(can_edit=True)
+        response = self.client.get(url, secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title_en'], 'Cafe')
+
+    def test_patch_response_query_count_is_flat(self):
+        UserPermission.objects.create(user=self.user, listing=self.listing, can_edit=True)
+        category = Category.objects.create(name='Food', slug='food')
+        url = f'/api/listings/{self.listing.pk}/edit/'
+
+        def patch_queries(title):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.patch(url, {'title_en': title}, format='json', secure=True)
+            self.assertEqual(response.json()['title'], title)
+            self.assertTrue(response.json()['can_edit'])
+            return len(queries)
+
+        Promotion.objects.create(title='P1', title_en='P1', category=category).listings.add(self.listing)
+        baseline = patch_queries('Bar')
+        for title in ('P2', 'P3'):
+            Promotion.objects.create(title=title, title_en=title, category=category).listings.add(self.listing)
+        self.assertEqual(patch_queries('Pub'), baseline)
+
+
 class SearchLimitCapTests(TestCase):
     """Confirm global_search limit parameter is capped at 50."""
 
@@ -382,6 +464,93 @@ class SupportEndpointPermissionTests(TestCase):
         )
         self.assertIn(response.status_code, [401, 403])
 
+    def test_help_support_post_assigns_submitter(self):
+        user = User.objects.create_user('asker', 'asker@test.com')
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.post(
+            '/api/help-support/',
+            {'name': 'Asker', 'email': 'asker@test.com', 'subject': 'Hi', 'message': 'hi'},
+            format='json',
+            secure=True,
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(HelpSupport.objects.get().user, user)
+
+    def test_help_support_update_cannot_set_admin_fields(self):
+        user = User.objects.create_user('asker', 'asker@test.com')
+        ticket = HelpSupport.objects.create(user=user, name='Asker', email=user.email, subject='Hi', message='Hi')
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.patch(
+            f'/api/help-support/{ticket.pk}/',
+            {'subject': 'Updated', 'status': 'resolved', 'admin_response': 'Done'},
+            format='json',
+            secure=True,
+        )
+        self.assertEqual(response.status_code, 200)
+        ticket.refresh_from_db()
+        self.assertEqual(ticket.subject, 'Updated')
+        self.assertEqual(ticket.status, 'open')
+        self.assertEqual(ticket.admin_response, '')
+
+    def test_regular_user_lists_only_own_collaboration_requests(self):
+        mine, theirs = User.objects.create_user('mine', 'mine@test.com'), User.objects.create_user('theirs', 'theirs@test.com')
+        for owner in (mine, theirs):
+            CollaborationContact.objects.create(
+                user=owner, name=owner.username, email=owner.email, company_name='Co', collaboration_type='other', proposal='Hi',
+            )
+        client = APIClient()
+        client.force_authenticate(user=mine)
+        results = client.get('/api/collaboration-contact/', secure=True).json()['results']
+        self.assertEqual([row['user'] for row in results], ['mine'])
+
+    def test_superuser_help_support_list_query_count_is_flat(self):
+        admin = User.objects.create_superuser('admin', 'admin@test.com', 'pass')
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        def list_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(client.get('/api/help-support/', secure=True).status_code, 200)
+            return len(queries)
+
+        def submit(username):
+            user = User.objects.create_user(username, f'{username}@test.com')
+            HelpSupport.objects.create(user=user, name=username, email=user.email, subject='Hi', message='Hi', responded_by=admin)
+
+        submit('first')
+        baseline = list_queries()
+        submit('second')
+        submit('third')
+        self.assertEqual(list_queries(), baseline)
+
+    def test_collaboration_types_follow_request_language(self):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user('partner', 'partner@test.com'))
+        response = client.get('/api/collaboration-contact/collaboration_types/', secure=True, HTTP_ACCEPT_LANGUAGE='mk')
+        labels = {option['value']: option['label'] for option in response.json()}
+        self.assertEqual(labels['other'], 'Друга колаборација')
+
+    def test_collaboration_types_fall_back_to_profile_language(self):
+        user = User.objects.create_user('partner', 'partner@test.com')
+        UserProfile.objects.create(user=user, language_preference='mk')
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.get('/api/collaboration-contact/collaboration_types/', secure=True)
+        labels = {option['value']: option['label'] for option in response.json()}
+        self.assertEqual(labels['other'], 'Друга колаборација')
+
+    def test_help_support_categories_are_publicly_cacheable(self):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user('helper', 'helper@test.com'))
+        response = client.get('/api/help-support/categories/', secure=True, HTTP_ACCEPT_LANGUAGE='mk')
+        self.assertEqual(response.status_code, 200)
+        cache_control = response['Cache-Control']
+        self.assertIn('public', cache_control)
+        self.assertIn('max-age=86400', cache_control)
+        self.assertIn('Accept-Language', response['Vary'])
+
 
 class AccountDeletionTests(TestCase):
     """GDPR right-to-erasure: DELETE /api/auth/me/ removes the account."""
@@ -401,6 +570,56 @@ class AccountDeletionTests(TestCase):
         self.assertFalse(User.objects.filter(username='delme').exists())
 
 
+class ListingAdminFormTests(TestCase):
+    """Cleared JSON textareas in the listing admin save as empty values, not NULL."""
+
+    def test_cleared_json_fields_fall_back_to_empty_defaults(self):
+        from core.admin import ListingAdminForm
+
+        form = ListingAdminForm(data={'tags': '', 'working_hours': '', 'menu_mk': ''})
+        form.is_valid()
+        for name in ('tags', 'working_hours', 'menu_mk'):
+            self.assertNotIn(name, form.errors)
+        self.assertEqual(form.cleaned_data['tags'], [])
+        self.assertEqual(form.cleaned_data['working_hours'], {})
+        self.assertEqual(form.cleaned_data['menu_mk'], [])
+
+
+class MeUpdateTests(TestCase):
+    """PUT /api/auth/me/ writes back only the columns that changed."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user('before', 'before@test.com', 'pass')
+        self.client.force_authenticate(user=self.user)
+
+    def test_username_change_updates_only_username(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put('/api/auth/me/', {'username': 'after'}, format='json', secure=True)
+        self.assertEqual(response.json()['username'], 'after')
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE "auth_user"')]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn('"password"', updates[0])
+
+    def test_password_change_is_hashed_and_saved(self):
+        self.client.put('/api/auth/me/', {'current_password': 'pass', 'new_password': 'n3w-pass'}, format='json', secure=True)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('n3w-pass'))
+
+    def test_avatar_only_change_skips_user_update(self):
+        UserProfile.objects.create(user=self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put('/api/auth/me/', {'avatar': 'avatar1'}, format='json', secure=True)
+        self.assertEqual(response.json()['profile']['avatar'], 'avatar1')
+        self.assertFalse(any(q['sql'].startswith('UPDATE "auth_user"') for q in queries))
+
+    def test_invalid_avatar_rejected_without_creating_profile(self):
+        response = self.client.put('/api/auth/me/', {'avatar': 'not-an-avatar'}, format='json', secure=True)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('avatar1', response.json()['error'])
+        self.assertFalse(UserProfile.objects.filter(user=self.user).exists())
+
+
 class AccountDataExportTests(TestCase):
     """GDPR data portability: GET /api/auth/me/export/ returns personal data."""
 
@@ -444,6 +663,47 @@ class AuthEmailFlowTests(TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
+    @override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+    def test_send_code_stores_one_live_code(self):
+        for _ in range(2):
+            response = self.client.post('/api/auth/send-code/', {'email': 'user@test.com'}, content_type='application/json', secure=True)
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(VerificationCode.objects.filter(email='user@test.com', is_used=False).count(), 1)
+
+    def test_overlapping_sends_keep_the_newer_code_usable(self):
+        sent_codes = []
+
+        def send(message, **kwargs):
+            sent_codes.append(message.split('Your verification code is: ')[1][:6])
+            if len(sent_codes) == 1:
+                # A second tap on "send code" is issued while the first email is in flight
+                self.client.post('/api/auth/send-code/', {'email': 'user@test.com'}, content_type='application/json', secure=True)
+
+        with patch('core.views.send_mail', side_effect=send):
+            response = self.client.post('/api/auth/send-code/', {'email': 'user@test.com'}, content_type='application/json', secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(VerificationCode.objects.filter(email='user@test.com', is_used=False).count(), 1)
+        response = self.client.post(
+            '/api/auth/verify-code/',
+            {'email': 'user@test.com', 'code': sent_codes[1], 'name': 'New User'},
+            content_type='application/json',
+            secure=True,
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_failed_send_keeps_only_the_earlier_code_live(self):
+        earlier = VerificationCode.objects.create(
+            email='user@test.com', code='earlier-hash', expires_at=timezone.now() + timedelta(minutes=15),
+        )
+        with patch('core.views.send_mail', side_effect=OSError('smtp down')):
+            response = self.client.post('/api/auth/send-code/', {'email': 'user@test.com'}, content_type='application/json', secure=True)
+        self.assertEqual(response.status_code, 503)
+        # Only the code already sent is still live; the unsent one is gone
+        self.assertEqual(
+            list(VerificationCode.objects.filter(email='user@test.com', is_used=False).values_list('pk', flat=True)),
+            [earlier.pk],
+        )
+
     def test_verify_code_requires_both_fields(self):
         response = self.client.post(
             '/api/auth/verify-code/',
@@ -496,7 +756,36 @@ class AuthIntegrationFlowTests(TestCase):
             secure=True,
         )
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(User.objects.filter(email=self.email).exists())
+        user = User.objects.get(email=self.email)
+        self.assertFalse(user.has_usable_password())
+        self.assertTrue(UserProfile.objects.filter(user=user).exists())
+
+    def test_login_reads_user_and_profile_in_one_query(self):
+        user = User.objects.create_user(username='integuser5', email=self.email)
+        UserProfile.objects.create(user=user, language_preference='mk')
+        self._create_verification_code()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                '/api/auth/verify-code/',
+                {'email': self.email, 'code': self.raw_code},
+                format='json',
+                secure=True,
+            )
+        self.assertEqual(response.json()['user']['profile']['language_preference'], 'mk')
+        self.assertEqual(sum('core_userprofile' in q['sql'] for q in queries), 1)
+
+    def test_registration_picks_next_free_username(self):
+        User.objects.create_user(username='integration', email='a@test.com')
+        User.objects.create_user(username='integration1', email='b@test.com')
+        User.objects.create_user(username='integrationist', email='c@test.com')
+        self._create_verification_code()
+        response = self.client.post(
+            '/api/auth/verify-code/',
+            {'email': self.email, 'code': self.raw_code, 'name': 'New User'},
+            format='json',
+            secure=True,
+        )
+        self.assertEqual(response.json()['user']['username'], 'integration2')
 
     def test_jwt_token_authenticates_me_endpoint(self):
         User.objects.create_user(username='integuser2', email=self.email)
@@ -547,3 +836,540 @@ class AuthIntegrationFlowTests(TestCase):
             secure=True,
         )
         self.assertEqual(response.status_code, 400)
+
+
+class ListingOpenStatusTests(TestCase):
+    """is_open must be evaluated against the clock snapshot shared through the serializer context."""
+
+    def setUp(self):
+        self.listing = Listing.objects.create(
+            title="Cafe", title_en="Cafe", title_mk="Кафе", is_active=True,
+            show_open_status=True, working_hours={'monday': '09:00-17:00'},
+        )
+
+    def _is_open(self, clock):
+        return ListingSerializer(self.listing, context={'open_status_clock': clock}).data['is_open']
+
+    def test_open_inside_working_hours(self):
+        self.assertTrue(self._is_open(('monday', 'mon', 10 * 60)))
+
+    def test_closed_outside_working_hours(self):
+        self.assertFalse(self._is_open(('monday', 'mon', 18 * 60)))
+        self.assertFalse(self._is_open(('tuesday', 'tue', 10 * 60)))
+
+
+@override_settings(CACHES=_DUMMY_CACHE)
+class WishlistListTests(TestCase):
+    """The wishlist list endpoint loads its targets in bulk, one query group per content type."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='wisher', email='wisher@example.com', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _wishlist(self, obj):
+        return Wishlist.objects.create(
+            user=self.user, content_type=ContentType.objects.get_for_model(obj), object_id=obj.pk,
+        )
+
+    def _list(self):
+        response = self.client.get('/api/wishlist/', secure=True)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def test_mixed_wishlist_returns_item_data_per_type(self):
+        listing = Listing.objects.create(title="Grill", title_en="Grill", title_mk="Скара", is_active=True)
+        event = Event.objects.create(title="Concert", title_en="Concert", location="Park", date_time="Fri, 20:00")
+        blog = Blog.objects.create(title="Guide", title_en="Guide", content="Text")
+        for obj in (listing, event, blog):
+            self._wishlist(obj)
+
+        results = self._list()
+        titles = {item['item_type']: item['item_data']['title'] for item in results}
+        self.assertEqual(titles, {'listing': 'Grill', 'event': 'Concert', 'blog': 'Guide'})
+
+    def test_deleted_target_returns_null_item_data(self):
+        promotion = Promotion.objects.create(title="Deal", title_en="Deal")
+        self._wishlist(promotion)
+        Promotion.objects.filter(pk=promotion.pk).delete()
+
+        results = self._list()
+        self.assertEqual(len(results), 1)
+        self.assertIsNone(results[0]['item_data'])
+
+    def test_create_returns_item_data(self):
+        event = Event.objects.create(title="Concert", title_en="Concert", location="Park", date_time="Fri, 20:00")
+        response = self.client.post(
+            '/api/wishlist/', {'item_type': 'event', 'item_id': event.pk}, format='json', secure=True,
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['item_data']['title'], 'Concert')
+
+    def test_duplicate_create_is_rejected(self):
+        event = Event.objects.create(title="Concert", title_en="Concert", location="Park", date_time="Fri, 20:00")
+        payload = {'item_type': 'event', 'item_id': event.pk}
+        self.assertEqual(self.client.post('/api/wishlist/', payload, format='json', secure=True).status_code, 201)
+        response = self.client.post('/api/wishlist/', payload, format='json', secure=True)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Wishlist.objects.filter(user=self.user).count(), 1)
+
+    def test_remove_deletes_item_and_reports_missing(self):
+        event = Event.objects.create(title="Concert", title_en="Concert", location="Park", date_time="Fri, 20:00")
+        self._wishlist(event)
+        payload = {'item_type': 'event', 'item_id': event.pk}
+        self.assertEqual(self.client.post('/api/wishlist/remove/', payload, format='json', secure=True).status_code, 200)
+        self.assertFalse(Wishlist.objects.filter(user=self.user).exists())
+        self.assertEqual(self.client.post('/api/wishlist/remove/', payload, format='json', secure=True).status_code, 404)
+
+    def test_bulk_check_returns_wishlisted_ids_per_type(self):
+        listing = Listing.objects.create(title="Grill", title_en="Grill", is_active=True)
+        other = Listing.objects.create(title="Bar", title_en="Bar", is_active=True)
+        event = Event.objects.create(title="Concert", title_en="Concert", location="Park", date_time="Fri, 20:00")
+        self._wishlist(listing)
+        items = [
+            {'item_type': 'listing', 'item_id': listing.pk},
+            {'item_type': 'listing', 'item_id': other.pk},
+            {'item_type': 'event', 'item_id': event.pk},
+        ]
+        ContentType.objects.get_for_models(Listing, Event)  # warm, as the startup thread does
+        with self.assertNumQueries(1):
+            response = self.client.post('/api/wishlist/bulk_check/', {'items': items}, format='json', secure=True)
+        self.assertEqual(response.json(), {'listing': [listing.pk], 'event': []})
+
+        bad = self.client.post('/api/wishlist/bulk_check/', {'items': [{'item_type': 'user', 'item_id': 1}]}, format='json', secure=True)
+        self.assertEqual(bad.status_code, 400)
+        for item_id in ('²', '-1', None):
+            bad = self.client.post('/api/wishlist/bulk_check/', {'items': [{'item_type': 'listing', 'item_id': item_id}]}, format='json', secure=True)
+            self.assertEqual(bad.status_code, 400)
+
+    def test_query_count_does_not_grow_with_wishlist_size(self):
+        self._wishlist(Listing.objects.create(title="One", title_en="One", is_active=True))
+        with CaptureQueriesContext(connection) as single:
+            self._list()
+        for i in range(5):
+            self._wishlist(Listing.objects.create(title=f"L{i}", title_en=f"L{i}", is_active=True))
+        with CaptureQueriesContext(connection) as many:
+            self._list()
+        self.assertEqual(len(single), len(many))
+
+
+class ORJSONRendererTests(TestCase):
+    """The orjson renderer must produce the same bytes as DRF's stock JSONRenderer."""
+
+    def test_output_matches_stock_renderer(self):
+        data = {
+            'title': 'Гевгелија ', 1: 'non-string key', 'price': Decimal('1.50'),
+            'created_at': timezone.now(), 'nested': [{'ok': True, 'missing': None}],
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_indented_output_matches_stock_renderer(self):
+        data = {'title': 'Гевгелија', 'nested': [{'ok': True}]}
+        for accepted in ('application/json; indent=4', 'application/json; indent=2'):
+            self.assertEqual(ORJSONRenderer().render(data, accepted), JSONRenderer().render(data, accepted))
+
+    def test_non_finite_floats_render_as_null(self):
+        # The stock renderer rejects these under STRICT_JSON; orjson writes null
+        data = {'nan': float('nan'), 'inf': float('inf')}
+        self.assertEqual(ORJSONRenderer().render(data), b'{"nan":null,"inf":null}')
+        with self.assertRaises(ValueError):
+            JSONRenderer().render(data)
+
+
+class ListingCanEditTests(TestCase):
+    """can_edit is resolved from the per-request set of editable listing ids."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='owner', email='owner@example.com', password='pass1234')
+        self.editable = Listing.objects.create(title="Mine", title_en="Mine", is_active=True)
+        self.other = Listing.objects.create(title="Other", title_en="Other", is_active=True)
+        UserPermission.objects.create(user=self.user, listing=self.editable, can_edit=True)
+        self.client = APIClient()
+
+    def _can_edit_by_id(self):
+        response = self.client.get('/api/listings/', secure=True)
+        self.assertEqual(response.status_code, 200)
+        return {item['id']: item['can_edit'] for item in response.json()['results']}
+
+    def test_authenticated_user_can_edit_only_permitted_listing(self):
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self._can_edit_by_id(), {self.editable.pk: True, self.other.pk: False})
+
+    def test_anonymous_user_cannot_edit(self):
+        self.assertEqual(self._can_edit_by_id(), {self.editable.pk: False, self.other.pk: False})
+
+    def test_detail_reports_can_edit(self):
+        self.client.force_authenticate(self.user)
+        for listing, expected in ((self.editable, True), (self.other, False)):
+            response = self.client.get(f'/api/listings/{listing.pk}/', secure=True)
+            self.assertEqual(response.json()['can_edit'], expected)
+
+
+@override_settings(CACHES=_DUMMY_CACHE)
+class EventHasJoinedTests(TestCase):
+    """has_joined comes from the per-request set of joined event ids."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='joiner', email='joiner@example.com', password='pass1234')
+        self.event = Event.objects.create(
+            title="Concert", title_en="Concert", location="Park", date_time="Fri, 20:00", is_active=True,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_reflects_membership(self):
+        EventJoin.objects.create(user=self.user, event=self.event)
+        response = self.client.get('/api/events/', secure=True)
+        self.assertTrue(response.json()['results'][0]['has_joined'])
+
+    def test_join_response_reports_joined(self):
+        response = self.client.post(f'/api/events/{self.event.pk}/join/', secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['event']['has_joined'])
+        self.assertEqual(response.json()['event']['join_count'], 1)
+
+    def test_join_twice_and_unjoin_twice_are_rejected(self):
+        url = f'/api/events/{self.event.pk}/'
+        self.assertEqual(self.client.post(url + 'join/', secure=True).status_code, 200)
+        self.assertEqual(self.client.post(url + 'join/', secure=True).status_code, 400)
+
+        response = self.client.post(url + 'unjoin/', secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()['event']['has_joined'])
+        self.assertEqual(response.json()['event']['join_count'], 0)
+        self.assertEqual(self.client.post(url + 'unjoin/', secure=True).status_code, 400)
+
+    def test_slim_join_response(self):
+        response = self.client.post(f'/api/events/{self.event.pk}/join/?full=0', secure=True)
+        self.assertEqual(response.json(), {'message': 'Successfully joined the event!', 'join_count': 1})
+
+
+@override_settings(CACHES=_DUMMY_CACHE)
+class ContentListQueryCountTests(TestCase):
+    """List endpoints prefetch nested relations, so the query count does not grow with the page."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.category = Category.objects.create(name="Food", slug="food", is_active=True)
+
+    def _add_rows(self, count):
+        for _ in range(count):
+            listing = Listing.objects.create(title="L", title_en="L", description="Text", is_active=True, category=self.category)
+            promotion = Promotion.objects.create(title="P", title_en="P", description="Text", is_active=True, category=self.category)
+            event = Event.objects.create(
+                title="E", title_en="E", description="Text", location="Park", date_time="Fri", is_active=True,
+                category=self.category,
+            )
+            listing.promotions.add(promotion)
+            event.listings.add(listing)
+            blog = Blog.objects.create(title="B", title_en="B", content="Text", published=True, is_active=True)
+            BlogSection.objects.create(blog=blog, title="S", content="Text")
+
+    def _query_count(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url, secure=True).status_code, 200)
+        return len(queries)
+
+    def test_list_endpoints_query_count_is_constant(self):
+        self._add_rows(1)
+        urls = ('/api/listings/', '/api/events/', '/api/promotions/', '/api/blogs/', '/api/search/?q=Text')
+        baseline = {url: self._query_count(url) for url in urls}
+        self._add_rows(4)
+        self.assertEqual({url: self._query_count(url) for url in urls}, baseline)
+
+    def test_fast_featured_returns_plain_cards(self):
+        listing = Listing.objects.create(
+            title="Cafe", title_en="Cafe", title_mk="Кафе", featured=True, is_active=True, category=self.category,
+        )
+        Listing.objects.filter(pk=listing.pk).update(image_2='listings/cafe.jpg')
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/listings/featured/?fast=1', secure=True, HTTP_ACCEPT_LANGUAGE='mk')
+        self.assertEqual(response.json(), [
+            {'id': listing.pk, 'title': 'Кафе', 'image': 'https://testserver/media/listings/cafe.jpg'},
+        ])
+
+
+class ListingGalleryViewTests(TestCase):
+    """Gallery photo URLs are absolute and use the request host."""
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media_root.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+        buf = io.BytesIO()
+        Image.new('RGB', (10, 10), color='red').save(buf, format='JPEG')
+        self.listing = Listing.objects.create(
+            title='Cafe', title_en='Cafe', is_active=True,
+            image=SimpleUploadedFile('cafe.jpg', buf.getvalue(), content_type='image/jpeg'),
+        )
+        GalleryPhoto.objects.create(
+            listing=self.listing, caption='Terrace',
+            image=SimpleUploadedFile('terrace.jpg', buf.getvalue(), content_type='image/jpeg'),
+        )
+
+    def test_gallery_urls_are_absolute(self):
+        response = APIClient().get(f'/api/listings/{self.listing.pk}/gallery/', secure=True)
+        self.assertEqual(response.status_code, 200)
+        photos = response.json()
+        self.assertEqual([photo['source'] for photo in photos], ['listing', 'extra'])
+        for photo in photos:
+            self.assertTrue(photo['image_url'].startswith('https://testserver/'), photo['image_url'])
+            self.assertTrue(photo['thumbnail_url'].startswith('https://testserver/'), photo['thumbnail_url'])
+
+
+class ProfileJWTAuthenticationTests(TestCase):
+    """The JWT user arrives with its profile loaded, so language resolution costs no query."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('reader', 'reader@test.com')
+        UserProfile.objects.create(user=self.user, language_preference='mk')
+
+    def _authenticate(self, user):
+        token = str(AccessToken.for_user(user))
+        request = MagicMock(spec=['META', 'headers'])
+        request.META = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        authenticated_user, _ = ProfileJWTAuthentication().authenticate(request)
+        request.user = authenticated_user
+        return request
+
+    def test_profile_language_needs_no_extra_query(self):
+        request = self._authenticate(self.user)
+        request.headers = {}
+        with self.assertNumQueries(0):
+            self.assertEqual(get_preferred_language(request), 'mk')
+
+    def test_language_is_resolved_once_per_request(self):
+        request = self._authenticate(self.user)
+        request.headers = {}
+        self.assertEqual(get_preferred_language(request), 'mk')
+        request.user.profile.language_preference = 'en'
+        self.assertEqual(get_preferred_language(request), 'mk')
+
+    def test_user_without_profile_falls_back_to_header(self):
+        request = self._authenticate(User.objects.create_user('bare', 'bare@test.com'))
+        request.headers = {'Accept-Language': 'mk-MK,en;q=0.8'}
+        self.assertEqual(get_preferred_language(request), 'mk')
+
+
+class LanguageViewTests(TestCase):
+    """Language updates write the preference with a single UPDATE, creating the profile if missing."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('polyglot', 'polyglot@test.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_update_creates_then_updates_profile(self):
+        for language in ('mk', 'en'):
+            response = self.client.post('/api/auth/language/', {'language': language}, format='json', secure=True)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(UserProfile.objects.get(user=self.user).language_preference, language)
+
+    def test_unknown_guest_is_not_found(self):
+        response = self.client.post(
+            '/api/auth/language/',
+            {'language': 'mk', 'guest_id': '00000000-0000-0000-0000-000000000000'},
+            format='json',
+            secure=True,
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_guest_get_reads_preference(self):
+        guest = GuestUser.objects.create(language_preference='mk')
+        response = self.client.get(f'/api/auth/language/?guest_id={guest.guest_id}', secure=True)
+        self.assertEqual(response.json(), {'language': 'mk', 'is_guest': True})
+        missing = self.client.get('/api/auth/language/?guest_id=00000000-0000-0000-0000-000000000000', secure=True)
+        self.assertEqual(missing.status_code, 404)
+
+
+class AdminUsersViewTests(TestCase):
+    """The admin user list joins profiles and paginates on request."""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin', 'admin@test.com', 'pass')
+        for i in range(3):
+            user = User.objects.create_user(f'user{i}', f'user{i}@test.com')
+            UserProfile.objects.create(user=user, language_preference='mk')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_full_list_without_page_params(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/admin/users/', secure=True)
+        users = response.json()
+        self.assertEqual([u['username'] for u in users], ['admin', 'user0', 'user1', 'user2'])
+        self.assertIsNone(users[0]['profile'])
+        self.assertEqual(users[1]['profile']['language_preference'], 'mk')
+
+    def test_paginated_when_requested(self):
+        response = self.client.get('/api/admin/users/?page_size=2', secure=True)
+        data = response.json()
+        self.assertEqual(data['count'], 4)
+        self.assertEqual(len(data['results']), 2)
+
+
+class UserPermissionListTests(TestCase):
+    """by_user / by_listing load the nested user and listing payloads in bulk."""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin', 'admin@test.com', 'pass')
+        self.user = User.objects.create_user('editor', 'editor@test.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _grant(self, count):
+        for _ in range(count):
+            listing = Listing.objects.create(title="L", title_en="L", is_active=True)
+            listing.promotions.add(Promotion.objects.create(title="P", title_en="P", is_active=True))
+            UserPermission.objects.create(user=self.user, listing=listing, granted_by=self.admin)
+
+    def _query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/admin/permissions/by_user/?user_id={self.user.pk}', secure=True)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_by_user_query_count_is_constant(self):
+        self._grant(1)
+        baseline = self._query_count()
+        self._grant(4)
+        self.assertEqual(self._query_count(), baseline)
+
+    def test_by_listing_paginates_on_request(self):
+        self._grant(3)
+        listing_id = UserPermission.objects.first().listing_id
+        plain = self.client.get(f'/api/admin/permissions/by_listing/?listing_id={listing_id}', secure=True).json()
+        self.assertEqual(len(plain), 1)
+        data = self.client.get(f'/api/admin/permissions/by_user/?user_id={self.user.pk}&page_size=2', secure=True).json()
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(len(data['results']), 2)
+
+
+class TranslationResourceViewTests(TestCase):
+    """Translation files are read once, served as raw bytes and re-read only when they change."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        (self.root / 'en').mkdir()
+        self.path = self.root / 'en' / 'common.json'
+        self.path.write_text('{"hello": "Hello"}', encoding='utf-8')
+
+    def test_serves_and_refreshes_resource(self):
+        client = APIClient()
+        with override_settings(TRANSLATIONS_DIR=self.root):
+            response = client.get('/api/i18n/en/common/', secure=True)
+            self.assertEqual(response.json(), {'hello': 'Hello'})
+            self.assertEqual(response['Cache-Control'], 'public, max-age=3600')
+
+            self.path.write_text('{"hello": "Hi"}', encoding='utf-8')
+            stat = self.path.stat()
+            os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(client.get('/api/i18n/en/common/', secure=True).json(), {'hello': 'Hi'})
+
+            self.assertEqual(client.get('/api/i18n/en/legal/', secure=True).status_code, 404)
+
+    def test_matching_etag_returns_not_modified(self):
+        client = APIClient()
+        with override_settings(TRANSLATIONS_DIR=self.root):
+            response = client.get('/api/i18n/en/common/', secure=True)
+            self.assertEqual(response['Content-Type'], 'application/json')
+            etag = response['ETag']
+            cached = client.get('/api/i18n/en/common/', secure=True, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(cached.status_code, 304)
+            self.assertEqual(cached.content, b'')
+
+    def test_gzip_clients_get_precompressed_body(self):
+        client = APIClient()
+        with override_settings(TRANSLATIONS_DIR=self.root):
+            response = client.get('/api/i18n/en/common/', secure=True, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(response.content)), {'hello': 'Hello'})
+
+
+@override_settings(CACHES=_DUMMY_CACHE)
+class CursorPaginationTests(TestCase):
+    """Blogs and promotions page by number unless the client sends ?cursor=."""
+
+    def setUp(self):
+        self.client = APIClient()
+        for title in ('First', 'Second', 'Third'):
+            Blog.objects.create(title=title, title_en=title, content="Text", published=True, is_active=True)
+
+    def test_page_number_contract_is_default(self):
+        data = self.client.get('/api/blogs/?page_size=2', secure=True).json()
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(len(data['results']), 2)
+
+    def test_cursor_pages_walk_newest_first(self):
+        first = self.client.get('/api/blogs/?cursor=&page_size=2', secure=True).json()
+        self.assertNotIn('count', first)
+        self.assertEqual([b['title'] for b in first['results']], ['Third', 'Second'])
+        second = self.client.get(first['next'], secure=True).json()
+        self.assertEqual([b['title'] for b in second['results']], ['First'])
+        self.assertIsNone(second['next'])
+
+
+class PruneVerificationCodesCommandTests(TestCase):
+    """prune_verification_codes deletes only codes older than the cutoff."""
+
+    def test_deletes_old_codes(self):
+        fresh = VerificationCode.objects.create(email='a@test.com', code='x', expires_at=timezone.now())
+        old = VerificationCode.objects.create(email='a@test.com', code='y', expires_at=timezone.now())
+        VerificationCode.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=2))
+        call_command('prune_verification_codes', stdout=io.StringIO())
+        self.assertEqual(list(VerificationCode.objects.values_list('pk', flat=True)), [fresh.pk])
+
+
+class GuestLoginViewTests(TestCase):
+    """Guest pings bump last_active with a narrow UPDATE, and not on every request."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.guest = GuestUser.objects.create()
+
+    def _ping(self):
+        return self.client.get(f'/api/auth/guest/?guest_id={self.guest.guest_id}', secure=True)
+
+    def test_recent_ping_skips_write(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self._ping().status_code, 200)
+
+    def test_stale_ping_updates_last_active(self):
+        stale = timezone.now() - timedelta(hours=1)
+        GuestUser.objects.filter(pk=self.guest.pk).update(last_active=stale)
+        with CaptureQueriesContext(connection) as queries:
+            self._ping()
+        self.assertNotIn('language_preference', queries[1]['sql'])
+        self.guest.refresh_from_db()
+        self.assertGreater(self.guest.last_active, stale)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'per-caller'}})
+class PerCallerCacheTests(TestCase):
+    """Cached event/listing payloads never carry another caller's per-user flags."""
+
+    def setUp(self):
+        self.event = Event.objects.create(
+            title="Concert", title_en="Concert", location="Park", date_time="Fri, 20:00", featured=True, is_active=True,
+        )
+        self.joiner = User.objects.create_user('joiner', 'joiner@test.com')
+        self.other = User.objects.create_user('other', 'other@test.com')
+        EventJoin.objects.create(user=self.joiner, event=self.event)
+
+    def _featured_has_joined(self, user):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        return client.get('/api/events/featured/', secure=True).json()[0]['has_joined']
+
+    def test_featured_events_are_cached_per_caller(self):
+        self.assertTrue(self._featured_has_joined(self.joiner))
+        self.assertFalse(self._featured_has_joined(self.other))
+        self.assertTrue(self._featured_has_joined(self.joiner))
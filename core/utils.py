@@ -1,30 +1,49 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
 from django.conf import settings
 
+from .models import UserProfile
 
-_SUPPORTED_LANG_CODES = {code for code, _ in settings.LANGUAGES}
 
+_SUPPORTED_LANG_CODES = frozenset(code for code, _ in settings.LANGUAGES)
+_DEFAULT_LANG = settings.LANGUAGE_CODE
 
+
+@lru_cache(maxsize=512)
 def _normalize_language(code: Optional[str]) -> str:
-    """Collapse a raw language value to a supported language code."""
+    """Collapse a raw language value to a supported language code.
+
+    Memoized: clients send a small set of distinct header values.
+    """
     if not code:
-        return settings.LANGUAGE_CODE
+        return _DEFAULT_LANG
 
     # Split Accept-Language style values "mk,en;q=0.8"
     primary = code.split(',')[0].strip()
     if not primary:
-        return settings.LANGUAGE_CODE
+        return _DEFAULT_LANG
 
     # Extract base language (ignore regional subtags)
     base = primary.split('-')[0].lower()
-    return base if base in _SUPPORTED_LANG_CODES else settings.LANGUAGE_CODE
+    return base if base in _SUPPORTED_LANG_CODES else _DEFAULT_LANG
 
 
 def get_preferred_language(request) -> str:
-    """Resolve the language that should drive localized responses."""
+    """Resolve the language that should drive localized responses.
+
+    The result is cached on the request, so repeated calls (one per serializer
+    context, view helpers...) resolve it once.
+    """
+    cached = vars(request).get("_preferred_language")
+    if cached is None:
+        cached = request._preferred_language = _resolve_preferred_language(request)
+    return cached
+
+
+def _resolve_preferred_language(request) -> str:
     # LocaleMiddleware sets LANGUAGE_CODE using Accept-Language headers
     lang_from_request = getattr(request, "LANGUAGE_CODE", None)
     if lang_from_request:
@@ -32,10 +51,14 @@ def get_preferred_language(request) -> str:
         if lang:
             return lang
 
-    # Fall back to the user's persisted preference
+    # Fall back to the user's persisted preference. ProfileJWTAuthentication
+    # select_related()s the profile, so this normally costs no query.
     user = getattr(request, "user", None)
-    if getattr(user, "is_authenticated", False) and hasattr(user, "profile"):
-        profile_lang = _normalize_language(user.profile.language_preference)
+    if getattr(user, "is_authenticated", False):
+        try:
+            profile_lang = _normalize_language(user.profile.language_preference)
+        except UserProfile.DoesNotExist:
+            profile_lang = None
         if profile_lang:
             return profile_lang
 
@@ -44,4 +67,4 @@ def get_preferred_language(request) -> str:
     if header_lang:
         return header_lang
 
-    return settings.LANGUAGE_CODE
+    return _DEFAULT_LANG
@@ -1,51 +1,94 @@
+import gzip
 import json
 import logging
 import re
 import secrets
-import string
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from datetime import timedelta
 
+import orjson
 import requests
 from rest_framework import viewsets, permissions, status
 from rest_framework.views import APIView
 from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.throttling import AnonRateThrottle
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.views.decorators.cache import cache_control, cache_page
+from django.views.decorators.vary import vary_on_headers
 from django.contrib.admin.views.decorators import staff_member_required
 from rest_framework.response import Response
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.prefetch import GenericPrefetch
-from django.db.models import Prefetch, Count, Q
+from django.db.models import F, Prefetch, Count, Q, prefetch_related_objects
+from modeltranslation.translator import translator
 from django.contrib.auth import authenticate
 from django.db import models
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.conf import settings
 from django.core.cache import cache
 from django.core.mail import send_mail
 from django.core.validators import validate_email
+from django.http import HttpResponse, HttpResponseNotModified
 from django.shortcuts import get_object_or_404, render
 from django.utils import timezone
 from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
 from django.core.exceptions import ValidationError
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from .models import Category, Listing, Event, Promotion, Blog, EventJoin, Wishlist, UserProfile, UserPermission, HelpSupport, CollaborationContact, GuestUser, VerificationCode, HomeSection, HomeSectionItem, TourismCarousel, TourismCategoryButton, GalleryPhoto
-from .serializers import CategorySerializer, ListingSerializer, EventSerializer, PromotionSerializer, BlogSerializer, UserSerializer, WishlistSerializer, WishlistCreateSerializer, UserProfileSerializer, UserPermissionSerializer, CreateUserPermissionSerializer, EditListingSerializer, HelpSupportSerializer, HelpSupportCreateSerializer, CollaborationContactSerializer, CollaborationContactCreateSerializer, GuestUserSerializer, HomeSectionSerializer, TourismCarouselSerializer, TourismCategoryButtonSerializer, AssistantQuerySerializer, GalleryPhotoSerializer
+from .serializers import _absolute_url, _get_optimized_image_url, featured_cards, open_status_clock, editable_listing_ids, joined_event_ids, CategorySerializer, ListingSerializer, ListingSlimSerializer, EventSerializer, PromotionSerializer, BlogSerializer, UserSerializer, WishlistSerializer, WishlistCreateSerializer, WISHLIST_MODELS, UserProfileSerializer, UserPermissionSerializer, CreateUserPermissionSerializer, EditListingSerializer, HelpSupportSerializer, HelpSupportCreateSerializer, CollaborationContactSerializer, CollaborationContactCreateSerializer, GuestUserSerializer, HomeSectionSerializer, TourismCarouselSerializer, TourismCategoryButtonSerializer, AssistantQuerySerializer, GalleryPhotoSerializer
 from .assistant_ai import AssistantAIError, get_assistant_ai_provider
 from .assistant_parser import get_assistant_query_parser
+from .authentication import ProfileJWTAuthentication
 from .utils import get_preferred_language
-from .pagination import StandardResultsSetPagination
+from .pagination import PageOrCursorPagination, StandardResultsSetPagination
 
 assistant_query_logger = logging.getLogger("assistant_queries")
 core_logger = logging.getLogger("core")
 
+def _columns_without_translation_sources(model):
+    """
+    Field names of ``model`` minus the source columns modeltranslation keeps
+    beside the per-language copies. Serializers only read ``title_en``/``title_mk``
+    (the ``title`` descriptor resolves through them too), so querysets can
+    ``.only()`` these and skip fetching every translated text twice.
+    """
+    sources = translator.get_options_for_model(model).fields
+    return tuple(field.name for field in model._meta.concrete_fields if field.name not in sources)
+
+
+LISTING_COLUMNS = _columns_without_translation_sources(Listing)
+EVENT_COLUMNS = _columns_without_translation_sources(Event)
+PROMOTION_COLUMNS = _columns_without_translation_sources(Promotion)
+BLOG_COLUMNS = _columns_without_translation_sources(Blog)
+
+# Relations rendered by the detail serializers, including the relations of
+# those nested rows, so list endpoints run a fixed number of queries.
+# Listings nested in a promotion only need the columns of ListingSlimSerializer.
+_SLIM_LISTINGS = Listing.objects.only(*ListingSlimSerializer.only_fields)
+LISTING_PREFETCH = (
+    'promotions__category',
+    Prefetch('promotions__listings', queryset=_SLIM_LISTINGS),
+    'events__category',
+)
+EVENT_PREFETCH = ('listings__category',)
+PROMOTION_PREFETCH = (Prefetch('listings', queryset=_SLIM_LISTINGS),)
+BLOG_PREFETCH = ('blog_sections',)
+# UserPermissionSerializer nests the full ListingSerializer under 'listing'
+PERMISSION_PREFETCH = (
+    'listing__promotions__category',
+    Prefetch('listing__promotions__listings', queryset=_SLIM_LISTINGS),
+    'listing__events__category',
+)
+
 
 def _normalize_email(email: str | None) -> str:
     return (email or "").strip().lower()
@@ -79,7 +122,39 @@ class IsSuperUser(permissions.BasePermission):
         return bool(request.user and request.user.is_authenticated and request.user.is_superuser)
 
 
-class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
+def _cache_per_caller(timeout):
+    """
+    cache_page for payloads with per-user fields (can_edit, has_joined).
+    - The Authorization header is part of the cache key, so one caller's flags
+      are never served to another; anonymous callers still share one entry
+    """
+    def decorator(view_func):
+        return cache_page(timeout)(vary_on_headers('Authorization')(view_func))
+    return decorator
+
+
+# Context for payloads cached once and shared by every caller: per-user flags
+# are rendered as for an anonymous visitor instead of for whoever warmed the cache
+SHARED_PAYLOAD_CONTEXT = {'editable_listing_ids': frozenset(), 'joined_event_ids': frozenset()}
+
+
+class LanguageContextMixin:
+    """Put the request's preferred language in the serializer context for localized fields."""
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['language'] = get_preferred_language(self.request)
+        return context
+
+
+def _fast_featured_response(request, queryset):
+    """``?fast=1`` on the featured actions: id/title/image cards without the serializer, else None."""
+    if request.query_params.get('fast') != '1':
+        return None
+    return Response(featured_cards(queryset, request, get_preferred_language(request)))
+
+
+class CategoryViewSet(LanguageContextMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Category.objects.filter(is_active=True)
     serializer_class = CategorySerializer
     permission_classes = [permissions.AllowAny]
@@ -95,10 +170,10 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
 
         return queryset.order_by('order', 'name')
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context['language'] = get_preferred_language(self.request)
-        return context
+    @method_decorator(cache_page(60 * 15))  # Cache for 15 minutes, like featured/trending
+    def list(self, request, *args, **kwargs):
+        """Get all active categories with caching"""
+        return super().list(request, *args, **kwargs)
 
     @action(detail=False, methods=['get'], url_path='for-listings')
     def for_listings(self, request):
@@ -166,7 +241,7 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
         serializer = self.get_serializer(categories, many=True)
         return Response(serializer.data)
 
-class ListingViewSet(viewsets.ReadOnlyModelViewSet):
+class ListingViewSet(LanguageContextMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Listing.objects.filter(is_active=True)
     serializer_class = ListingSerializer
     permission_classes = [permissions.AllowAny]
@@ -180,9 +255,10 @@ class ListingViewSet(viewsets.ReadOnlyModelViewSet):
         Listings are ordered by random_order field for fair rotation (shuffled by cron job).
         """
         queryset = Listing.objects.filter(is_active=True) \
+            .only(*LISTING_COLUMNS) \
             .select_related('category') \
             .order_by('random_order') \
-            .prefetch_related('promotions', 'events', 'user_permissions')
+            .prefetch_related(*LISTING_PREFETCH)
 
         # Filter by category — accepts id, slug, or comma-separated ids (e.g. "1,2,3").
         category = self.request.query_params.get('category', None)
@@ -198,30 +274,49 @@ class ListingViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context['language'] = get_preferred_language(self.request)
+        # Same clock for every row on the page instead of one strftime pair per listing
+        context['open_status_clock'] = open_status_clock()
         return context
 
-    @method_decorator(cache_page(60 * 10))  # Cache for 10 minutes
+    def get_serializer(self, instance=None, *args, **kwargs):
+        """Answer can_edit from one permission lookup scoped to the rendered listings."""
+        context = kwargs.setdefault('context', self.get_serializer_context())
+        user = self.request.user
+        if not user.is_authenticated:
+            context['editable_listing_ids'] = frozenset()
+        elif instance is not None:
+            # Iterating a queryset fills its result cache, which the serializer then reuses
+            listings = instance if kwargs.get('many') else [instance]
+            context['editable_listing_ids'] = editable_listing_ids(user, [listing.pk for listing in listings])
+        return super().get_serializer(instance, *args, **kwargs)
+
+    @method_decorator(_cache_per_caller(60 * 10))  # Cache for 10 minutes
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Get only featured listings (no pagination for featured items)"""
-        featured_listings = Listing.objects.filter(featured=True, is_active=True) \
+        featured_listings = Listing.objects.filter(featured=True, is_active=True)
+        fast_response = _fast_featured_response(request, featured_listings)
+        if fast_response is not None:
+            return fast_response
+        featured_listings = featured_listings \
+            .only(*LISTING_COLUMNS) \
             .select_related('category') \
-            .prefetch_related('promotions', 'events')
+            .prefetch_related(*LISTING_PREFETCH)
         serializer = self.get_serializer(featured_listings, many=True)
         return Response(serializer.data)
 
-    @method_decorator(cache_page(60 * 15))  # Cache for 5 minutes
+    @method_decorator(_cache_per_caller(60 * 15))  # Cache for 5 minutes
     @action(detail=False, methods=['get'])
     def trending(self, request):
         """Get only trending listings (no pagination for trending items)"""
         trending_listings = Listing.objects.filter(trending=True, is_active=True) \
+            .only(*LISTING_COLUMNS) \
             .select_related('category') \
-            .prefetch_related('promotions', 'events')
+            .prefetch_related(*LISTING_PREFETCH)
         serializer = self.get_serializer(trending_listings, many=True)
         return Response(serializer.data)
 
-class EventViewSet(viewsets.ReadOnlyModelViewSet):
+class EventViewSet(LanguageContextMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Event.objects.filter(is_active=True)
     serializer_class = EventSerializer
     permission_classes = [permissions.AllowAny]
@@ -230,11 +325,12 @@ class EventViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         """
         PERFORMANCE FIX: Added select_related and prefetch_related to avoid N+1 queries.
-        Also prefetch event joins for current user to optimize has_joined checks.
+        has_joined is answered from the joined_event_ids set in the serializer context.
         """
         queryset = Event.objects.filter(is_active=True) \
+            .only(*EVENT_COLUMNS) \
             .select_related('category') \
-            .prefetch_related('listings')
+            .prefetch_related(*EVENT_PREFETCH)
 
         # Filter by category — accepts id or slug.
         category = self.request.query_params.get('category', None)
@@ -244,113 +340,105 @@ class EventViewSet(viewsets.ReadOnlyModelViewSet):
             else:
                 queryset = queryset.filter(category__slug=category)
 
-        # Prefetch user's event joins if authenticated
-        if self.request.user.is_authenticated:
-            from django.db.models import Prefetch
-            queryset = queryset.prefetch_related(
-                Prefetch(
-                    'joined_users',  # FIX: Use correct related_name from EventJoin model
-                    queryset=EventJoin.objects.filter(user=self.request.user),
-                    to_attr='user_joins'
-                )
-            )
-
         return queryset.order_by('-featured', '-created_at')
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context['language'] = get_preferred_language(self.request)
+        # One query for the user's joins instead of one per event
+        user = self.request.user
+        context['joined_event_ids'] = joined_event_ids(user) if user.is_authenticated else frozenset()
         return context
 
-    @method_decorator(cache_page(60 * 15))  # Cache for 5 minutes
+    @method_decorator(_cache_per_caller(60 * 15))  # Cache for 5 minutes
     def list(self, request, *args, **kwargs):
         """Get all events with caching"""
         return super().list(request, *args, **kwargs)
 
-    @method_decorator(cache_page(60 * 15))  # Cache for 3 minutes (events change more frequently)
+    @method_decorator(_cache_per_caller(60 * 15))  # Cache for 3 minutes (events change more frequently)
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Get only featured events (no pagination for featured items)"""
-        featured_events = Event.objects.filter(featured=True, is_active=True) \
+        featured_events = Event.objects.filter(featured=True, is_active=True)
+        fast_response = _fast_featured_response(request, featured_events)
+        if fast_response is not None:
+            return fast_response
+        featured_events = featured_events \
+            .only(*EVENT_COLUMNS) \
             .select_related('category') \
-            .prefetch_related('listings')
-
-        # Prefetch user joins for has_joined optimization
-        if request.user.is_authenticated:
-            from django.db.models import Prefetch
-            featured_events = featured_events.prefetch_related(
-                Prefetch(
-                    'joined_users',  # FIX: Use correct related_name from EventJoin model
-                    queryset=EventJoin.objects.filter(user=request.user),
-                    to_attr='user_joins'
-                )
-            )
-
+            .prefetch_related(*EVENT_PREFETCH)
         serializer = self.get_serializer(featured_events, many=True)
         return Response(serializer.data)
     
+    def _join_response(self, request, event, message):
+        """
+        Response for join/unjoin.
+        - ?full=0 skips re-serializing the event and only echoes the new
+          join_count; the default keeps the full event for existing clients
+        """
+        if request.query_params.get('full') == '0':
+            return Response({
+                'message': message,
+                'join_count': event.join_count,
+            }, status=status.HTTP_200_OK)
+        serializer = self.get_serializer(event)
+        return Response({
+            'message': message,
+            'event': serializer.data
+        }, status=status.HTTP_200_OK)
+
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def join(self, request, pk=None):
         """Join an event - requires authenticated user (not guest)"""
         event = self.get_object()
 
-        # Check if user already joined
-        existing_join = EventJoin.objects.filter(event=event, user=request.user).first()
-        if existing_join:
+        # Insert directly; EventJoin's unique (user, event) index rejects a second join.
+        # The counter bump shares the transaction so join_count never drifts from the rows
+        try:
+            with transaction.atomic():
+                EventJoin.objects.create(event=event, user=request.user)
+                # PERFORMANCE FIX: Update join count using F() expression instead of counting all joins
+                Event.objects.filter(pk=event.pk).update(join_count=F('join_count') + 1)
+        except IntegrityError:
             return Response({
                 'error': 'You have already joined this event'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # Create join record
-        EventJoin.objects.create(event=event, user=request.user)
-
-        # PERFORMANCE FIX: Update join count using F() expression instead of counting all joins
-        from django.db.models import F
-        Event.objects.filter(pk=event.pk).update(join_count=F('join_count') + 1)
-        event.refresh_from_db()  # Refresh to get updated count
+        event.refresh_from_db(fields=['join_count'])
 
-        serializer = self.get_serializer(event)
-        return Response({
-            'message': 'Successfully joined the event!',
-            'event': serializer.data
-        }, status=status.HTTP_200_OK)
+        return self._join_response(request, event, 'Successfully joined the event!')
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def unjoin(self, request, pk=None):
         """Unjoin an event (leave the event) - requires authenticated user"""
         event = self.get_object()
 
-        # Check if user has joined
-        existing_join = EventJoin.objects.filter(event=event, user=request.user).first()
-        if not existing_join:
+        # Single DELETE; the row count tells whether the user had joined
+        with transaction.atomic():
+            deleted, _ = EventJoin.objects.filter(event=event, user=request.user).delete()
+            if deleted:
+                # PERFORMANCE FIX: Update join count using F() expression instead of counting all joins
+                Event.objects.filter(pk=event.pk, join_count__gt=0).update(join_count=F('join_count') - 1)
+        if not deleted:
             return Response({
                 'error': 'You have not joined this event'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # Remove join record
-        existing_join.delete()
+        event.refresh_from_db(fields=['join_count'])
 
-        # PERFORMANCE FIX: Update join count using F() expression instead of counting all joins
-        from django.db.models import F
-        Event.objects.filter(pk=event.pk).update(join_count=F('join_count') - 1)
-        event.refresh_from_db()  # Refresh to get updated count
+        return self._join_response(request, event, 'Successfully left the event!')
 
-        serializer = self.get_serializer(event)
-        return Response({
-            'message': 'Successfully left the event!',
-            'event': serializer.data
-        }, status=status.HTTP_200_OK)
-
-class PromotionViewSet(viewsets.ReadOnlyModelViewSet):
+class PromotionViewSet(LanguageContextMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Promotion.objects.filter(is_active=True)
     serializer_class = PromotionSerializer
     permission_classes = [permissions.AllowAny]
-    pagination_class = StandardResultsSetPagination
+    # ?cursor= opts into keyset pagination for infinite scroll
+    pagination_class = PageOrCursorPagination
 
     def get_queryset(self):
         queryset = Promotion.objects.filter(is_active=True) \
+            .only(*PROMOTION_COLUMNS) \
             .select_related('category') \
-            .prefetch_related('listings') \
+            .prefetch_related(*PROMOTION_PREFETCH) \
             .order_by('-created_at')
         category = self.request.query_params.get('category', None)
         if category:
@@ -360,11 +448,6 @@ class PromotionViewSet(viewsets.ReadOnlyModelViewSet):
                 queryset = queryset.filter(category__slug=category)
         return queryset
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context['language'] = get_preferred_language(self.request)
-        return context
-
     @method_decorator(cache_page(60 * 15))  # Cache for 5 minutes
     def list(self, request, *args, **kwargs):
         """Get all promotions with caching"""
@@ -374,30 +457,35 @@ class PromotionViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Get only featured promotions (no pagination for featured items)"""
-        featured_promotions = Promotion.objects.filter(featured=True, is_active=True) \
-            .prefetch_related('listings')
+        featured_promotions = Promotion.objects.filter(featured=True, is_active=True)
+        fast_response = _fast_featured_response(request, featured_promotions)
+        if fast_response is not None:
+            return fast_response
+        featured_promotions = featured_promotions \
+            .only(*PROMOTION_COLUMNS) \
+            .select_related('category') \
+            .prefetch_related(*PROMOTION_PREFETCH)
         serializer = self.get_serializer(featured_promotions, many=True)
         return Response(serializer.data)
 
-class BlogViewSet(viewsets.ReadOnlyModelViewSet):
+class BlogViewSet(LanguageContextMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Blog.objects.filter(published=True, is_active=True)
     serializer_class = BlogSerializer
     permission_classes = [permissions.AllowAny]
-    pagination_class = StandardResultsSetPagination
+    # ?cursor= opts into keyset pagination for infinite scroll
+    pagination_class = PageOrCursorPagination
 
     def get_queryset(self):
         """
         PERFORMANCE FIX: Optimized query ordering.
-        Note: Blog.category is a CharField (not ForeignKey), so no select_related needed.
+        Note: Blog.category is a CharField (not ForeignKey), so no select_related needed;
+        the nested sections are prefetched in one query per page.
         """
         return Blog.objects.filter(published=True, is_active=True) \
+            .only(*BLOG_COLUMNS) \
+            .prefetch_related(*BLOG_PREFETCH) \
             .order_by('-created_at')
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context['language'] = get_preferred_language(self.request)
-        return context
-
     @method_decorator(cache_page(60 * 15))  # Cache for 5 minutes
     def list(self, request, *args, **kwargs):
         """Get all blogs with caching"""
@@ -408,6 +496,10 @@ class BlogViewSet(viewsets.ReadOnlyModelViewSet):
     def featured(self, request):
         """Get only featured blogs (no pagination for featured items)"""
         featured_blogs = Blog.objects.filter(featured=True, published=True, is_active=True)
+        fast_response = _fast_featured_response(request, featured_blogs)
+        if fast_response is not None:
+            return fast_response
+        featured_blogs = featured_blogs.only(*BLOG_COLUMNS).prefetch_related(*BLOG_PREFETCH)
         serializer = self.get_serializer(featured_blogs, many=True)
         return Response(serializer.data)
 
@@ -552,7 +644,7 @@ class SendVerificationCode(APIView):
             )
 
         # Generate a 6-digit code
-        code = ''.join(secrets.choice(string.digits) for _ in range(6))
+        code = f"{secrets.randbelow(1_000_000):06d}"
 
         # Set expiration (15 minutes from now)
         expires_at = timezone.now() + timedelta(minutes=15)
@@ -573,28 +665,35 @@ Best regards,
 The GoGevgelija Team
         """.strip()
 
+        # The SMTP round trip happens outside any transaction. Older codes are only
+        # invalidated once the new one has been sent, so a failed send leaves the
+        # code already in the user's inbox usable
+        verification = None
         try:
-            with transaction.atomic():
-                VerificationCode.objects.filter(email=email, is_used=False).update(is_used=True)
-                VerificationCode.objects.create(
-                    email=email,
-                    code=code_hash,
-                    expires_at=expires_at,
-                )
-                send_mail(
-                    subject=subject,
-                    message=message,
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[email],
-                    fail_silently=False,
-                )
+            verification = VerificationCode.objects.create(
+                email=email,
+                code=code_hash,
+                expires_at=expires_at,
+            )
+            send_mail(
+                subject=subject,
+                message=message,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                recipient_list=[email],
+                fail_silently=False,
+            )
         except Exception:
             core_logger.exception("Failed to send verification code email for %s", masked_email)
+            if verification is not None:
+                # Never leave a live code behind that the user did not receive
+                VerificationCode.objects.filter(pk=verification.pk).delete()
             return Response(
                 {"error": "Unable to send verification code right now"},
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
 
+        # Only codes issued before this one: a concurrent send's newer code stays live
+        VerificationCode.objects.filter(email=email, is_used=False, pk__lt=verification.pk).update(is_used=True)
         core_logger.info("Verification code email sent to %s", masked_email)
 
         return Response({
@@ -652,19 +751,27 @@ class VerifyCode(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Mark code as used
-        verification.is_used = True
-        verification.save()
+        # Mark code as used; the conditional UPDATE lets only one concurrent request claim it
+        claimed = VerificationCode.objects.filter(pk=verification.pk, is_used=False).update(is_used=True)
+        if not claimed:
+            return Response(
+                {"error": "Invalid verification code"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        matching_users = User.objects.filter(email__iexact=email).order_by('date_joined')
-        if matching_users.count() > 1:
+        # Two rows are enough to detect duplicates and pick the account in one query
+        # The profile is joined in for the response below
+        matching_users = list(
+            User.objects.filter(email__iexact=email).select_related('profile').order_by('date_joined')[:2]
+        )
+        if len(matching_users) > 1:
             core_logger.warning("Duplicate user emails detected for %s", _mask_email(email))
             return Response(
                 {"error": "This email is linked to multiple accounts. Please contact support."},
                 status=status.HTTP_409_CONFLICT,
             )
 
-        user = matching_users.first()
+        user = matching_users[0] if matching_users else None
         if user is None:
             # Register new user
             if not name:
@@ -677,21 +784,25 @@ class VerifyCode(APIView):
             username = email.split('@')[0]
             counter = 1
             original_username = username
-            while User.objects.filter(username=username).exists():
+            # One query for exactly the names the suffix loop could collide with
+            # (the base plus digits), not every username sharing the prefix
+            taken = set(
+                User.objects.filter(username__regex=rf'^{re.escape(original_username)}[0-9]*$')
+                .values_list('username', flat=True)
+            )
+            while username in taken:
                 username = f"{original_username}{counter}"
                 counter += 1
 
-            user = User.objects.create_user(
-                username=username,
-                email=email,
-                first_name=name
-            )
-            # No password needed for passwordless auth
-            user.set_unusable_password()
-            user.save()
-
-            # Create user profile
-            UserProfile.objects.create(user=user)
+            # User and profile are committed together; create_user without a
+            # password already stores an unusable one (passwordless auth)
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=username,
+                    email=email,
+                    first_name=name
+                )
+                UserProfile.objects.create(user=user)
 
         # Generate JWT tokens
         refresh = RefreshToken.for_user(user)
@@ -759,6 +870,10 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
 
+# Rapid guest pings within this window skip the last_active write
+GUEST_ACTIVITY_UPDATE_INTERVAL = timedelta(minutes=5)
+
+
 class GuestLoginView(APIView):
     """View for creating guest user sessions"""
     permission_classes = [permissions.AllowAny]
@@ -784,16 +899,27 @@ class GuestLoginView(APIView):
 
         try:
             guest_user = GuestUser.objects.get(guest_id=guest_id)
-            # Update last_active timestamp
-            guest_user.save()
-            serializer = GuestUserSerializer(guest_user)
-            return Response(serializer.data)
         except GuestUser.DoesNotExist:
             return Response(
                 {"error": "Guest user not found"},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        # Update last_active with a one-column UPDATE, at most once per interval
+        now = timezone.now()
+        if now - guest_user.last_active >= GUEST_ACTIVITY_UPDATE_INTERVAL:
+            GuestUser.objects.filter(pk=guest_user.pk).update(last_active=now)
+            guest_user.last_active = now
+        serializer = GuestUserSerializer(guest_user)
+        return Response(serializer.data)
+
+# Avatar ids accepted by Me.put, built once from the model choices
+_VALID_AVATARS = frozenset(choice[0] for choice in UserProfile.AVATAR_CHOICES)
+_INVALID_AVATAR_ERROR = (
+    f"Invalid avatar. Must be one of: {', '.join(choice[0] for choice in UserProfile.AVATAR_CHOICES)}"
+)
+
+
 class Me(APIView):
     permission_classes = [permissions.AllowAny]
     
@@ -833,6 +959,8 @@ class Me(APIView):
 
         user = request.user
         data = request.data
+        # Only the columns that actually change are written back
+        update_fields = []
 
         # Update username if provided
         if 'username' in data and data['username']:
@@ -843,6 +971,7 @@ class Me(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             user.username = data['username']
+            update_fields.append('username')
 
         # Handle password change if provided
         if 'new_password' in data and data['new_password']:
@@ -856,27 +985,28 @@ class Me(APIView):
 
             # Set new password
             user.set_password(data['new_password'])
+            update_fields.append('password')
 
         # Handle avatar change if provided
         if 'avatar' in data:
+            # Validate avatar choice
+            if data['avatar'] not in _VALID_AVATARS:
+                return Response(
+                    {"error": _INVALID_AVATAR_ERROR},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
             try:
                 profile = user.profile
             except UserProfile.DoesNotExist:
                 profile = UserProfile.objects.create(user=user)
 
-            # Validate avatar choice
-            valid_avatars = [choice[0] for choice in UserProfile.AVATAR_CHOICES]
-            if data['avatar'] in valid_avatars:
-                profile.avatar = data['avatar']
-                profile.save()
-            else:
-                return Response(
-                    {"error": f"Invalid avatar. Must be one of: {', '.join(valid_avatars)}"},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+            profile.avatar = data['avatar']
+            profile.save(update_fields=['avatar', 'updated_at'])
 
         # Save user changes
-        user.save()
+        if update_fields:
+            user.save(update_fields=update_fields)
 
         # Include profile data in response
         profile_data = {}
@@ -951,17 +1081,20 @@ class LanguageView(APIView):
         # Check if it's a guest user
         guest_id = request.query_params.get('guest_id')
         if guest_id:
-            try:
-                guest_user = GuestUser.objects.get(guest_id=guest_id)
-                return Response({'language': guest_user.language_preference, 'is_guest': True})
-            except GuestUser.DoesNotExist:
+            # Only the one column is read
+            language = GuestUser.objects.filter(guest_id=guest_id) \
+                .values_list('language_preference', flat=True).first()
+            if language is None:
                 return Response(
                     {'error': 'Guest user not found'},
                     status=status.HTTP_404_NOT_FOUND
                 )
+            return Response({'language': language, 'is_guest': True})
 
         # Authenticated user
         if request.user.is_authenticated:
+            # ProfileJWTAuthentication already joined the profile, so this is
+            # normally query-free; the miss path only runs once per user
             try:
                 profile = request.user.profile
                 return Response({'language': profile.language_preference, 'is_guest': False})
@@ -996,30 +1129,28 @@ class LanguageView(APIView):
         # Check if it's a guest user
         guest_id = request.data.get('guest_id')
         if guest_id:
-            try:
-                guest_user = GuestUser.objects.get(guest_id=guest_id)
-                guest_user.language_preference = language
-                guest_user.save()
-                return Response({
-                    'message': 'Language preference updated successfully',
-                    'language': language,
-                    'is_guest': True
-                })
-            except GuestUser.DoesNotExist:
+            # Single UPDATE; auto_now fields are not touched by update(), so set them here
+            updated = GuestUser.objects.filter(guest_id=guest_id).update(
+                language_preference=language, last_active=timezone.now()
+            )
+            if not updated:
                 return Response(
                     {'error': 'Guest user not found'},
                     status=status.HTTP_404_NOT_FOUND
                 )
+            return Response({
+                'message': 'Language preference updated successfully',
+                'language': language,
+                'is_guest': True
+            })
 
         # Authenticated user
         if request.user.is_authenticated:
-            try:
-                profile = request.user.profile
-            except UserProfile.DoesNotExist:
-                profile = UserProfile.objects.create(user=request.user)
-
-            profile.language_preference = language
-            profile.save()
+            updated = UserProfile.objects.filter(user=request.user).update(
+                language_preference=language, updated_at=timezone.now()
+            )
+            if not updated:
+                UserProfile.objects.create(user=request.user, language_preference=language)
 
             return Response({
                 'message': 'Language preference updated successfully',
@@ -1033,6 +1164,21 @@ class LanguageView(APIView):
         )
 
 
+@lru_cache(maxsize=32)
+def _load_translation_resource(path, mtime_ns):
+    """
+    (raw, gzipped) bytes of a translation file; keyed by mtime so an edited file is re-read.
+    The file is parsed once here to reject invalid JSON, then served as-is,
+    and compressed once so GZipMiddleware does not redo it on every request.
+    """
+    content = Path(path).read_bytes()
+    json.loads(content)
+    return content, gzip.compress(content, compresslevel=6, mtime=0)
+
+
+_ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+
+
 class TranslationResourceView(APIView):
     """Expose translation resources so the mobile app can load them dynamically."""
     permission_classes = [permissions.AllowAny]
@@ -1055,29 +1201,89 @@ class TranslationResourceView(APIView):
             return Response({'error': 'Translations directory not configured'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
         resource_path = Path(translations_root) / language / f'{ns}.json'
-        if not resource_path.exists():
-            return Response({'error': 'Resource not found'}, status=status.HTTP_404_NOT_FOUND)
-
         try:
-            payload = json.loads(resource_path.read_text(encoding='utf-8'))
+            # One stat per request; the read + parse only happens when the file changes
+            stat = resource_path.stat()
+            content, compressed = _load_translation_resource(str(resource_path), stat.st_mtime_ns)
+        except FileNotFoundError:
+            return Response({'error': 'Resource not found'}, status=status.HTTP_404_NOT_FOUND)
         except json.JSONDecodeError:
             return Response({'error': 'Invalid translation resource'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        return Response(payload)
+        # The file is already JSON; serve its bytes instead of re-encoding a parsed copy.
+        # Weak ETag: the plain and gzipped bodies are the same resource
+        etag = f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = HttpResponseNotModified()
+        elif _ACCEPTS_GZIP.search(request.headers.get('Accept-Encoding', '')):
+            response = HttpResponse(compressed, content_type='application/json')
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(content, content_type='application/json')
+        patch_vary_headers(response, ('Accept-Encoding',))
+        response['ETag'] = etag
+        response['Cache-Control'] = 'public, max-age=3600'
+        return response
 
-class WishlistViewSet(viewsets.ModelViewSet):
+class WishlistViewSet(LanguageContextMixin, viewsets.ModelViewSet):
     serializer_class = WishlistSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         """Return wishlist items for the current user only."""
+        # WishlistManager joins content_type, which item_type reads on every row
         return Wishlist.objects.filter(user=self.request.user)
 
-    def get_serializer_context(self):
-        """Add language context for nested serializers."""
-        context = super().get_serializer_context()
-        context['language'] = get_preferred_language(self.request)
-        return context
+    def _target_querysets(self):
+        """Eager-loaded querysets and serializers for each wishlistable model."""
+        return {
+            'listing': (
+                Listing.objects.only(*LISTING_COLUMNS).select_related('category').prefetch_related(*LISTING_PREFETCH),
+                ListingSerializer,
+            ),
+            'event': (
+                Event.objects.only(*EVENT_COLUMNS).select_related('category').prefetch_related(*EVENT_PREFETCH),
+                EventSerializer,
+            ),
+            'promotion': (
+                Promotion.objects.only(*PROMOTION_COLUMNS).select_related('category').prefetch_related(*PROMOTION_PREFETCH),
+                PromotionSerializer,
+            ),
+            'blog': (Blog.objects.only(*BLOG_COLUMNS).prefetch_related(*BLOG_PREFETCH), BlogSerializer),
+        }
+
+    def _serialize_targets(self, items, context):
+        """
+        Serialize wishlist targets with one query (plus prefetches) per content type.
+        Returns {(content_type_id, object_id): item_data}; deleted targets map to None.
+        """
+        ids_by_type = defaultdict(list)
+        for item in items:
+            ids_by_type[item.content_type].append(item.object_id)
+
+        item_data = {(item.content_type_id, item.object_id): None for item in items}
+        target_querysets = self._target_querysets()
+        for content_type, object_ids in ids_by_type.items():
+            if content_type.model not in target_querysets:
+                continue
+            queryset, serializer_class = target_querysets[content_type.model]
+            serialized = serializer_class(queryset.filter(pk__in=object_ids), many=True, context=context).data
+            for row in serialized:
+                item_data[(content_type.id, row['id'])] = row
+        return item_data
+
+    def list(self, request, *args, **kwargs):
+        """List wishlist items, bulk-loading their targets per content type."""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        items = page if page is not None else list(queryset)
+
+        context = self.get_serializer_context()
+        context['wishlist_item_data'] = self._serialize_targets(items, context)
+        serializer = self.get_serializer(items, many=True, context=context)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
 
     def create(self, request, *args, **kwargs):
         """Add an item to the user's wishlist."""
@@ -1101,36 +1307,27 @@ class WishlistViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get the content type for the model
-        model_mapping = {
-            'listing': Listing,
-            'event': Event,
-            'promotion': Promotion,
-            'blog': Blog,
-        }
-        
-        if item_type not in model_mapping:
+        if item_type not in WISHLIST_MODELS:
             return Response(
                 {"error": "Invalid item_type. Must be 'listing', 'event', 'promotion', or 'blog'."},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        model_class = model_mapping[item_type]
+        model_class = WISHLIST_MODELS[item_type]
         content_type = ContentType.objects.get_for_model(model_class)
         
-        try:
-            wishlist_item = Wishlist.objects.get(
-                user=request.user,
-                content_type=content_type,
-                object_id=item_id
-            )
-            wishlist_item.delete()
-            return Response({"message": "Item removed from wishlist."}, status=status.HTTP_200_OK)
-        except Wishlist.DoesNotExist:
+        # Single DELETE; the row count tells whether the item was wishlisted
+        deleted, _ = Wishlist.objects.filter(
+            user=request.user,
+            content_type=content_type,
+            object_id=item_id
+        ).delete()
+        if not deleted:
             return Response(
                 {"error": "Item not found in wishlist."},
                 status=status.HTTP_404_NOT_FOUND
             )
+        return Response({"message": "Item removed from wishlist."}, status=status.HTTP_200_OK)
     
     @action(detail=False, methods=['post'])
     def check(self, request):
@@ -1144,21 +1341,13 @@ class WishlistViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get the content type for the model
-        model_mapping = {
-            'listing': Listing,
-            'event': Event,
-            'promotion': Promotion,
-            'blog': Blog,
-        }
-        
-        if item_type not in model_mapping:
+        if item_type not in WISHLIST_MODELS:
             return Response(
                 {"error": "Invalid item_type. Must be 'listing', 'event', 'promotion', or 'blog'."},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        model_class = model_mapping[item_type]
+        model_class = WISHLIST_MODELS[item_type]
         content_type = ContentType.objects.get_for_model(model_class)
         
         is_wishlisted = Wishlist.objects.filter(
@@ -1169,6 +1358,52 @@ class WishlistViewSet(viewsets.ModelViewSet):
         
         return Response({"is_wishlisted": is_wishlisted}, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=['post'])
+    def bulk_check(self, request):
+        """
+        Check many items in one request.
+        - Body: {"items": [{"item_type": "listing", "item_id": 5}, ...]}, at most 100 items
+        - Returns the wishlisted ids per requested type, e.g. {"listing": [5], "event": []}
+        """
+        items = request.data.get('items')
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"error": "items must be a non-empty list."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > 100:
+            return Response(
+                {"error": "At most 100 items can be checked at once."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        ids_by_type = {}
+        for item in items:
+            item_type = item.get('item_type') if isinstance(item, dict) else None
+            item_id = str(item.get('item_id')) if isinstance(item, dict) else ''
+            # isdigit() alone accepts non-ASCII digits such as '²' that int() rejects
+            if item_type not in WISHLIST_MODELS or not (item_id.isascii() and item_id.isdigit()):
+                return Response(
+                    {"error": "Each item needs a valid item_type and a numeric item_id."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            ids_by_type.setdefault(item_type, set()).add(int(item_id))
+
+        content_types = ContentType.objects.get_for_models(*(WISHLIST_MODELS[t] for t in ids_by_type))
+        type_by_ct_id = {}
+        condition = Q()
+        for item_type, ids in ids_by_type.items():
+            content_type = content_types[WISHLIST_MODELS[item_type]]
+            type_by_ct_id[content_type.id] = item_type
+            condition |= Q(content_type=content_type, object_id__in=ids)
+
+        # One query for every requested type
+        result = {item_type: [] for item_type in ids_by_type}
+        rows = Wishlist.objects.filter(condition, user=request.user).order_by().values_list('content_type_id', 'object_id')
+        for content_type_id, object_id in rows:
+            result[type_by_ct_id[content_type_id]].append(object_id)
+        return Response(result, status=status.HTTP_200_OK)
+
 
 class UserPermissionViewSet(viewsets.ModelViewSet):
     """ViewSet for managing user permissions (superuser only)."""
@@ -1177,7 +1412,10 @@ class UserPermissionViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Return all permissions. Only accessible by superusers."""
-        return UserPermission.objects.all()
+        # Nested user/listing/granted_by payloads are loaded in bulk, not per row
+        return UserPermission.objects \
+            .select_related('user__profile', 'granted_by__profile', 'listing__category') \
+            .prefetch_related(*PERMISSION_PREFETCH)
     
     def create(self, request, *args, **kwargs):
         """Create a new user permission."""
@@ -1189,6 +1427,15 @@ class UserPermissionViewSet(viewsets.ModelViewSet):
         response_serializer = UserPermissionSerializer(permission)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
     
+    def _filtered_list_response(self, permissions):
+        """Plain list by default; paginated when the client sends ?page= or ?page_size=."""
+        query_params = self.request.query_params
+        if 'page' in query_params or 'page_size' in query_params:
+            page = self.paginate_queryset(permissions)
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        serializer = self.get_serializer(permissions, many=True)
+        return Response(serializer.data)
+
     @action(detail=False, methods=['get'])
     def by_user(self, request):
         """Get permissions for a specific user."""
@@ -1199,9 +1446,7 @@ class UserPermissionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        permissions = UserPermission.objects.filter(user_id=user_id)
-        serializer = self.get_serializer(permissions, many=True)
-        return Response(serializer.data)
+        return self._filtered_list_response(self.get_queryset().filter(user_id=user_id))
     
     @action(detail=False, methods=['get'])
     def by_listing(self, request):
@@ -1213,60 +1458,51 @@ class UserPermissionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        permissions = UserPermission.objects.filter(listing_id=listing_id)
-        serializer = self.get_serializer(permissions, many=True)
-        return Response(serializer.data)
+        return self._filtered_list_response(self.get_queryset().filter(listing_id=listing_id))
 
 
 class EditListingView(APIView):
     """View for editing listings (requires permission)."""
     permission_classes = [permissions.IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
-    
-    def get(self, request, listing_id):
-        """Get listing details for editing."""
-        try:
-            listing = Listing.objects.get(id=listing_id)
-        except Listing.DoesNotExist:
-            return Response(
+
+    def _get_editable_listing(self, request, listing_id):
+        """
+        Fetch the listing together with the edit-permission check in one query.
+        Returns (listing, None) or (None, error response); telling 404 from 403
+        costs a second query only on the miss path.
+        """
+        listing = Listing.objects.select_related('category').filter(
+            id=listing_id,
+            user_permissions__user=request.user,
+            user_permissions__can_edit=True,
+        ).first()
+        if listing is not None:
+            return listing, None
+        if not Listing.objects.filter(id=listing_id).exists():
+            return None, Response(
                 {"error": "Listing not found"}, 
                 status=status.HTTP_404_NOT_FOUND
             )
-        
-        # Check if user has permission to edit this listing
-        if not UserPermission.objects.filter(
-            user=request.user, 
-            listing=listing, 
-            can_edit=True
-        ).exists():
-            return Response(
-                {"error": "You don't have permission to edit this listing"}, 
-                status=status.HTTP_403_FORBIDDEN
-            )
+        return None, Response(
+            {"error": "You don't have permission to edit this listing"}, 
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    def get(self, request, listing_id):
+        """Get listing details for editing."""
+        listing, error = self._get_editable_listing(request, listing_id)
+        if error:
+            return error
         
         serializer = EditListingSerializer(listing, context={'request': request})
         return Response(serializer.data)
     
     def patch(self, request, listing_id):
         """Update listing (requires permission)."""
-        try:
-            listing = Listing.objects.get(id=listing_id)
-        except Listing.DoesNotExist:
-            return Response(
-                {"error": "Listing not found"}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        # Check if user has permission to edit this listing
-        if not UserPermission.objects.filter(
-            user=request.user, 
-            listing=listing, 
-            can_edit=True
-        ).exists():
-            return Response(
-                {"error": "You don't have permission to edit this listing"}, 
-                status=status.HTTP_403_FORBIDDEN
-            )
+        listing, error = self._get_editable_listing(request, listing_id)
+        if error:
+            return error
         
         serializer = EditListingSerializer(
             listing,
@@ -1277,8 +1513,14 @@ class EditListingView(APIView):
         serializer.is_valid(raise_exception=True)
         updated_listing = serializer.save()
         
-        # Return the updated listing with full details
-        full_serializer = ListingSerializer(updated_listing, context={'request': request})
+        # Return the updated listing with full details. The instance fetched above is
+        # reused: its relations are batch-loaded only once the edit has succeeded, and
+        # the permission check already proved this caller can edit it
+        prefetch_related_objects([updated_listing], *LISTING_PREFETCH)
+        full_serializer = ListingSerializer(updated_listing, context={
+            'request': request,
+            'editable_listing_ids': frozenset({updated_listing.pk}),
+        })
         return Response(full_serializer.data)
 
 
@@ -1287,201 +1529,180 @@ class AdminUsersView(APIView):
     permission_classes = [IsSuperUser]
     
     def get(self, request):
-        """Get all users. Only accessible by superusers."""
-        users = User.objects.all().order_by('username')
-        serializer = UserSerializer(users, many=True)
-        return Response(serializer.data)
+        """
+        Get all users. Only accessible by superusers.
+        - Profiles are LEFT JOINed in and rows are read as plain tuples, then
+          shaped like UserSerializer output without building model instances
+        - Paginated when the client sends ?page= or ?page_size=; without them
+          the full list is returned as before
+        """
+        users = User.objects.order_by('username').values_list(
+            'id', 'username', 'email', 'profile__id', 'profile__language_preference', 'profile__avatar',
+        )
+        if 'page' in request.query_params or 'page_size' in request.query_params:
+            paginator = StandardResultsSetPagination()
+            page = paginator.paginate_queryset(users, request, view=self)
+            return paginator.get_paginated_response(self._user_rows(page))
+        return Response(self._user_rows(users))
+
+    @staticmethod
+    def _user_rows(rows):
+        # Users without a profile row keep rendering "profile": null
+        return [
+            {
+                'id': user_id,
+                'username': username,
+                'email': email,
+                'profile': None if profile_id is None else {
+                    'language_preference': language_preference,
+                    'avatar': avatar,
+                },
+            }
+            for user_id, username, email, profile_id, language_preference, avatar in rows
+        ]
 
 
-class HelpSupportViewSet(viewsets.ModelViewSet):
-    """ViewSet for Help & Support requests"""
-    permission_classes = [permissions.IsAuthenticated]
-    
+def _choice_options(choices, translations):
+    """
+    ``{language: JSON bytes of [{'value', 'label'}, ...]}`` for a model's choices,
+    built and encoded once at import so requests skip DRF's renderer.
+    """
+    return {
+        language: orjson.dumps([{'value': value, 'label': labels.get(value, label)} for value, label in choices])
+        for language, labels in translations.items()
+    }
+
+
+def _choice_response(options, language):
+    return HttpResponse(options.get(language, options['en']), content_type='application/json')
+
+
+_HELP_CATEGORY_OPTIONS = _choice_options(HelpSupport.CATEGORY_CHOICES, {
+    'en': {
+        'general': 'General Inquiry',
+        'technical': 'Technical Issue',
+        'listing': 'Listing Problem',
+        'event': 'Event Issue',
+        'account': 'Account Problem',
+        'feedback': 'Feedback',
+        'bug': 'Bug Report',
+        'feature': 'Feature Request',
+        'other': 'Other',
+    },
+    'mk': {
+        'general': 'Општо прашање',
+        'technical': 'Технички проблем',
+        'listing': 'Проблем со листинг',
+        'event': 'Проблем со настан',
+        'account': 'Проблем со сметка',
+        'feedback': 'Повратни информации',
+        'bug': 'Пријава на грешка',
+        'feature': 'Барање за функција',
+        'other': 'Друго',
+    },
+})
+
+_HELP_PRIORITY_OPTIONS = _choice_options(HelpSupport.PRIORITY_CHOICES, {
+    'en': {
+        'low': 'Low',
+        'medium': 'Medium',
+        'high': 'High',
+        'urgent': 'Urgent',
+    },
+    'mk': {
+        'low': 'Низок',
+        'medium': 'Среден',
+        'high': 'Висок',
+        'urgent': 'Итен',
+    },
+})
+
+_COLLABORATION_TYPE_OPTIONS = _choice_options(CollaborationContact.COLLABORATION_TYPE_CHOICES, {
+    'en': {
+        'business': 'Business Partnership',
+        'event': 'Event Collaboration',
+        'marketing': 'Marketing Partnership',
+        'tourism': 'Tourism Partnership',
+        'other': 'Other Collaboration',
+    },
+    'mk': {
+        'business': 'Деловно партнерство',
+        'event': 'Колаборација за настани',
+        'marketing': 'Маркетинг партнерство',
+        'tourism': 'Туристичко партнерство',
+        'other': 'Друга колаборација',
+    },
+})
+
+
+class SubmitterScopedMixin:
+    """
+    Shared by the support/contact viewsets:
+    - Superusers see every submission, other users only their own
+    - ``create`` validates with ``create_serializer_class``
+    """
+    create_serializer_class = None
+
     def get_queryset(self):
-        # Superusers can see all requests, regular users only see their own
+        queryset = super().get_queryset()
         if self.request.user.is_superuser:
-            return HelpSupport.objects.all()
-        return HelpSupport.objects.filter(user=self.request.user)
-    
+            return queryset
+        return queryset.filter(user_id=self.request.user.id)
+
     def get_serializer_class(self):
         if self.action == 'create':
-            return HelpSupportCreateSerializer
-        return HelpSupportSerializer
-    
-    def perform_create(self, serializer):
-        # Pre-fill name and email from user profile if available
-        user = self.request.user
-        defaults = {}
-        
-        # Get name from user profile or username
-        if hasattr(user, 'profile'):
-            defaults['name'] = f"{user.first_name} {user.last_name}".strip() or user.username
-        else:
-            defaults['name'] = user.username
-            
-        # Get email
-        defaults['email'] = user.email or ''
-        
-        # Apply defaults if not provided in request data
-        for field, default_value in defaults.items():
-            if field not in serializer.validated_data or not serializer.validated_data[field]:
-                serializer.validated_data[field] = default_value
-        
-        serializer.save(user=user)
-    
-    def perform_update(self, serializer):
-        # Only superusers can update admin-specific fields
-        if not self.request.user.is_superuser:
-            # Remove admin fields from validated_data for regular users
-            admin_fields = ['status', 'admin_response', 'responded_by', 'resolved_at']
-            for field in admin_fields:
-                serializer.validated_data.pop(field, None)
-        serializer.save()
+            return self.create_serializer_class
+        return super().get_serializer_class()
+
+
+class HelpSupportViewSet(SubmitterScopedMixin, viewsets.ModelViewSet):
+    """ViewSet for Help & Support requests"""
+    permission_classes = [permissions.IsAuthenticated]
+    # user/responded_by are rendered by name on every row
+    queryset = HelpSupport.objects.select_related('user', 'responded_by')
+    serializer_class = HelpSupportSerializer
+    create_serializer_class = HelpSupportCreateSerializer
     
+    # Static per language; the cache key already varies on the request language and
+    # LocaleMiddleware adds Vary: Accept-Language, so shared caches may keep them too.
+    # That is also why, unlike collaboration_types, there is no profile fallback here
+    @method_decorator(cache_page(60 * 60 * 24))
+    @method_decorator(cache_control(public=True))
     @action(detail=False, methods=['get'])
     def categories(self, request):
         """Get available help support categories with translations"""
         language = get_preferred_language(request)
-        
-        # Define translations
-        category_translations = {
-            'en': {
-                'general': 'General Inquiry',
-                'technical': 'Technical Issue',
-                'listing': 'Listing Problem',
-                'event': 'Event Issue',
-                'account': 'Account Problem',
-                'feedback': 'Feedback',
-                'bug': 'Bug Report',
-                'feature': 'Feature Request',
-                'other': 'Other',
-            },
-            'mk': {
-                'general': 'Општо прашање',
-                'technical': 'Технички проблем',
-                'listing': 'Проблем со листинг',
-                'event': 'Проблем со настан',
-                'account': 'Проблем со сметка',
-                'feedback': 'Повратни информации',
-                'bug': 'Пријава на грешка',
-                'feature': 'Барање за функција',
-                'other': 'Друго',
-            }
-        }
-        
-        translations = category_translations.get(language, category_translations['en'])
-        categories = [
-            {'value': choice[0], 'label': translations.get(choice[0], choice[1])} 
-            for choice in HelpSupport.CATEGORY_CHOICES
-        ]
-        return Response(categories)
+        return _choice_response(_HELP_CATEGORY_OPTIONS, language)
     
+    @method_decorator(cache_page(60 * 60 * 24))
+    @method_decorator(cache_control(public=True))
     @action(detail=False, methods=['get'])
     def priorities(self, request):
         """Get available priority levels with translations"""
         language = get_preferred_language(request)
-        
-        # Define translations
-        priority_translations = {
-            'en': {
-                'low': 'Low',
-                'medium': 'Medium',
-                'high': 'High',
-                'urgent': 'Urgent',
-            },
-            'mk': {
-                'low': 'Низок',
-                'medium': 'Среден',
-                'high': 'Висок',
-                'urgent': 'Итен',
-            }
-        }
-        
-        translations = priority_translations.get(language, priority_translations['en'])
-        priorities = [
-            {'value': choice[0], 'label': translations.get(choice[0], choice[1])} 
-            for choice in HelpSupport.PRIORITY_CHOICES
-        ]
-        return Response(priorities)
+        return _choice_response(_HELP_PRIORITY_OPTIONS, language)
 
 
-class CollaborationContactViewSet(viewsets.ModelViewSet):
+class CollaborationContactViewSet(SubmitterScopedMixin, viewsets.ModelViewSet):
     """ViewSet for Collaboration Contact requests"""
     permission_classes = [permissions.IsAuthenticated]
-    
-    def get_queryset(self):
-        # Superusers can see all requests, regular users only see their own
-        if self.request.user.is_superuser:
-            return CollaborationContact.objects.all()
-        return CollaborationContact.objects.filter(user=self.request.user)
-    
-    def get_serializer_class(self):
-        if self.action == 'create':
-            return CollaborationContactCreateSerializer
-        return CollaborationContactSerializer
-    
-    def perform_create(self, serializer):
-        # Pre-fill name and email from user profile if available
-        user = self.request.user
-        defaults = {}
-        
-        # Get name from user profile or username
-        if hasattr(user, 'profile'):
-            defaults['name'] = f"{user.first_name} {user.last_name}".strip() or user.username
-        else:
-            defaults['name'] = user.username
-            
-        # Get email
-        defaults['email'] = user.email or ''
-        
-        # Apply defaults if not provided in request data
-        for field, default_value in defaults.items():
-            if field not in serializer.validated_data or not serializer.validated_data[field]:
-                serializer.validated_data[field] = default_value
-        
-        serializer.save(user=user)
-    
-    def perform_update(self, serializer):
-        # Only superusers can update admin-specific fields
-        if not self.request.user.is_superuser:
-            # Remove admin fields from validated_data for regular users
-            admin_fields = ['status', 'admin_notes', 'reviewed_by', 'review_date']
-            for field in admin_fields:
-                serializer.validated_data.pop(field, None)
-        serializer.save()
+    # user/reviewed_by are rendered by name on every row
+    queryset = CollaborationContact.objects.select_related('user', 'reviewed_by')
+    serializer_class = CollaborationContactSerializer
+    create_serializer_class = CollaborationContactCreateSerializer
     
     @action(detail=False, methods=['get'])
     def collaboration_types(self, request):
         """Get available collaboration types with translations"""
-        # Get language preference from user profile
-        language = 'en'
-        if request.user.is_authenticated and hasattr(request.user, 'profile'):
-            language = request.user.profile.language_preference
-        
-        # Define translations
-        collaboration_type_translations = {
-            'en': {
-                'business': 'Business Partnership',
-                'event': 'Event Collaboration',
-                'marketing': 'Marketing Partnership',
-                'tourism': 'Tourism Partnership',
-                'other': 'Other Collaboration',
-            },
-            'mk': {
-                'business': 'Деловно партнерство',
-                'event': 'Колаборација за настани',
-                'marketing': 'Маркетинг партнерство',
-                'tourism': 'Туристичко партнерство',
-                'other': 'Друга колаборација',
-            }
-        }
-        
-        translations = collaboration_type_translations.get(language, collaboration_type_translations['en'])
-        types = [
-            {'value': choice[0], 'label': translations.get(choice[0], choice[1])}
-            for choice in CollaborationContact.COLLABORATION_TYPE_CHOICES
-        ]
-        return Response(types)
+        # An explicit Accept-Language wins (same per-request cached resolution as the
+        # help-support lists). Without one LocaleMiddleware only reports the site
+        # default, so the saved profile preference applies instead
+        profile = getattr(request.user, 'profile', None)
+        if 'Accept-Language' not in request.headers and profile is not None:
+            language = profile.language_preference
+        else:
+            language = get_preferred_language(request)
+        return _choice_response(_COLLABORATION_TYPE_OPTIONS, language)
 
 
 ASSISTANT_BORDER_CAMERA_URL = "https://roads.org.mk/patna-mreza/video-kameri/"
@@ -1931,33 +2152,41 @@ def _assistant_bilingual_search(query_en, query_mk, content_type, language, requ
     CONTENT_FIELDS = ['title', 'title_en', 'title_mk', 'address', 'description', 'description_en', 'description_mk']
     CATEGORY_FIELDS = ['category__name', 'category__name_en', 'category__name_mk']
 
-    def listing_qs(match_q):
-        return Listing.objects.filter(match_q, is_active=True).select_related('category').distinct()
+    def listing_batch(match_q):
+        # Evaluated once; an .exists() probe before slicing would cost a second query
+        fetch = limit * 2 if open_now else limit
+        return list(
+            Listing.objects.filter(match_q, is_active=True)
+            .select_related('category')
+            .prefetch_related(*LISTING_PREFETCH)
+            .distinct()[:fetch]
+        )
 
-    def serialize_listings(qs):
+    def serialize_listings(batch):
         ctx = {'request': request, 'language': language}
+        serialized_all = ListingSerializer(batch, many=True, context=ctx).data
         if open_now:
-            batch = list(qs[:limit * 2])
-            serialized_all = ListingSerializer(batch, many=True, context=ctx).data
             return [l for l in serialized_all if l.get('is_open')][:limit]
-        return ListingSerializer(qs[:limit], many=True, context=ctx).data
+        return serialized_all
 
     ctx = {'request': request, 'language': language}
     results = {'listings': [], 'events': [], 'promotions': [], 'blogs': []}
 
     if content_type in ('all', 'listings'):
         # Try content-only match first; fall back to including category names only if empty
-        qs = listing_qs(or_match(CONTENT_FIELDS))
-        if not qs.exists():
-            qs = listing_qs(or_match(CONTENT_FIELDS + CATEGORY_FIELDS))
-        results['listings'] = serialize_listings(qs)
+        batch = listing_batch(or_match(CONTENT_FIELDS))
+        if not batch:
+            batch = listing_batch(or_match(CONTENT_FIELDS + CATEGORY_FIELDS))
+        results['listings'] = serialize_listings(batch)
 
     if content_type in ('all', 'events'):
         event_content_fields = ['title', 'title_en', 'title_mk', 'location', 'description', 'description_en', 'description_mk']
         event_category_fields = ['category__name', 'category__name_en', 'category__name_mk']
-        qs = Event.objects.filter(or_match(event_content_fields), is_active=True).select_related('category').distinct()
+        qs = Event.objects.filter(or_match(event_content_fields), is_active=True) \
+            .select_related('category').prefetch_related(*EVENT_PREFETCH).distinct()
         if not qs.exists():
-            qs = Event.objects.filter(or_match(event_content_fields + event_category_fields), is_active=True).select_related('category').distinct()
+            qs = Event.objects.filter(or_match(event_content_fields + event_category_fields), is_active=True) \
+                .select_related('category').prefetch_related(*EVENT_PREFETCH).distinct()
         start, end = _assistant_time_filter_range(time_filter)
         if start and end:
             qs = qs.filter(date_time__gte=start, date_time__lt=end)
@@ -1976,7 +2205,7 @@ def _assistant_bilingual_search(query_en, query_mk, content_type, language, requ
             is_active=True,
         ).filter(
             models.Q(valid_until__gte=today) | models.Q(valid_until__isnull=True)
-        ).order_by('valid_until').distinct()
+        ).select_related('category').prefetch_related(*PROMOTION_PREFETCH).order_by('valid_until').distinct()
         results['promotions'] = PromotionSerializer(qs[:limit], many=True, context=ctx).data
 
     if content_type in ('all', 'blogs'):
@@ -1984,7 +2213,7 @@ def _assistant_bilingual_search(query_en, query_mk, content_type, language, requ
             or_match(['title', 'title_en', 'title_mk', 'subtitle', 'subtitle_en', 'subtitle_mk',
                       'content', 'content_en', 'content_mk']),
             is_active=True, published=True,
-        ).distinct()
+        ).prefetch_related(*BLOG_PREFETCH).distinct()
         results['blogs'] = BlogSerializer(qs[:limit], many=True, context=ctx).data
 
     total = sum(len(v) for v in results.values())
@@ -2945,7 +3174,7 @@ def _serialize_search_results(query, content_type='all', limit=20, language='en'
             Q(category__name_en__icontains=cleaned_query) |
             Q(category__name_mk__icontains=cleaned_query),
             is_active=True
-        ).distinct()[:limit]
+        ).select_related('category').prefetch_related(*LISTING_PREFETCH).distinct()[:limit]
         results['listings'] = ListingSerializer(listings, many=True, context={'request': request, 'language': language}).data
 
     if content_type in ['all', 'events']:
@@ -2961,7 +3190,7 @@ def _serialize_search_results(query, content_type='all', limit=20, language='en'
             Q(category__name_en__icontains=cleaned_query) |
             Q(category__name_mk__icontains=cleaned_query),
             is_active=True
-        ).distinct()[:limit]
+        ).select_related('category').prefetch_related(*EVENT_PREFETCH).distinct()[:limit]
         results['events'] = EventSerializer(events, many=True, context={'request': request, 'language': language}).data
 
     if content_type in ['all', 'promotions']:
@@ -2974,7 +3203,7 @@ def _serialize_search_results(query, content_type='all', limit=20, language='en'
             Q(description_mk__icontains=cleaned_query) |
             Q(discount_code__icontains=cleaned_query),
             is_active=True
-        ).distinct()[:limit]
+        ).select_related('category').prefetch_related(*PROMOTION_PREFETCH).distinct()[:limit]
         results['promotions'] = PromotionSerializer(promotions, many=True, context={'request': request, 'language': language}).data
 
     if content_type in ['all', 'blogs']:
@@ -2990,7 +3219,7 @@ def _serialize_search_results(query, content_type='all', limit=20, language='en'
             Q(content_mk__icontains=cleaned_query),
             is_active=True,
             published=True
-        ).distinct()[:limit]
+        ).prefetch_related(*BLOG_PREFETCH).distinct()[:limit]
         results['blogs'] = BlogSerializer(blogs, many=True, context={'request': request, 'language': language}).data
 
     total = sum(len(items) for items in results.values())
@@ -3323,7 +3552,7 @@ class _AssistantUserThrottle(__import__('rest_framework.throttling', fromlist=['
     scope = 'assistant_user'
 
 
-class _SilentJWTAuthentication(JWTAuthentication):
+class _SilentJWTAuthentication(ProfileJWTAuthentication):
     """JWT auth that treats expired/invalid tokens as anonymous instead of raising 401."""
     def authenticate(self, request):
         try:
@@ -3513,7 +3742,7 @@ def build_home_sections_payload(language: str, request=None) -> dict:
         serialized = HomeSectionSerializer(
             sections,
             many=True,
-            context={'request': request, 'language': language},
+            context={'request': request, 'language': language, **SHARED_PAYLOAD_CONTEXT},
         ).data
 
     results = [s for s in serialized if s.get('items')]
@@ -3536,7 +3765,7 @@ def warm_home_sections_cache():
         )
 
 
-class HomeSectionViewSet(viewsets.ReadOnlyModelViewSet):
+class HomeSectionViewSet(LanguageContextMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for HomeSection - read-only for mobile clients.
     Returns active sections with their items for dynamic HomeScreen rendering.
@@ -3551,11 +3780,6 @@ class HomeSectionViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         return _home_sections_queryset()
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context['language'] = get_preferred_language(self.request)
-        return context
-
     def list(self, request, *args, **kwargs):
         language = get_preferred_language(request)
         cache_key = HOME_SECTIONS_CACHE_KEY.format(lang=language)
@@ -3631,10 +3855,11 @@ class TourismScreenView(APIView):
             Prefetch('direct_blogs', queryset=Blog.objects.filter(is_active=True, published=True), to_attr='prefetched_blogs'),
         ).order_by("tourism_order", "-created_at")
 
-        # Build context for serializers
+        # Build context for serializers; the cached payload is shared by every caller
         context = {
             'request': request,
-            'language': language
+            'language': language,
+            **SHARED_PAYLOAD_CONTEXT,
         }
 
         # Serialize data
@@ -3735,12 +3960,6 @@ class ListingGalleryView(APIView):
         listing = get_object_or_404(Listing, pk=listing_id, is_active=True)
         language = get_preferred_language(request)
         req = request
-
-        def _abs(url):
-            if url and req:
-                return req.build_absolute_uri(url)
-            return url or ''
-
         photos = []
 
         # 1. Listing's own images (image, image_1..5)
@@ -3753,8 +3972,8 @@ class ListingGalleryView(APIView):
                     continue
                 photos.append({
                     'id': f'listing_{field_name}',
-                    'image_url': _abs(url),
-                    'thumbnail_url': _abs(url),
+                    'image_url': _absolute_url(url, req),
+                    'thumbnail_url': _absolute_url(url, req),
                     'caption': '',
                     'order': len(photos),
                     'source': 'listing',